@@ -1,25 +1,103 @@
 import requests
+import threading
+import time
+from collections import OrderedDict
 from xml.etree import ElementTree
 from typing import Optional, Dict, List
 
+from .circuit_breaker import CLOSED, CircuitBreaker
+from .tracing import span
+
 BGG_API_BASE = "https://boardgamegeek.com/xmlapi2/"
+# The thing endpoint rejects requests for more than 20 ids at once
+THING_BATCH_SIZE = 20
+REQUEST_TIMEOUT = 10
+# Last good responses kept for answering while the circuit is open
+DEGRADED_CACHE_SIZE = 512
+# Upper bound on requests sent to BGG, shared by every thread using the client
+REQUESTS_PER_SECOND = 4
+
+
+class RateLimiter:
+    """Spaces out calls so no more than `rate` start per second, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class BGGUnavailableError(Exception):
+    """Raised when BGG is unavailable and no cached answer exists."""
 
 
 class BGGClient:
-    def __init__(self):
+    def __init__(self, requests_per_second: float = REQUESTS_PER_SECOND):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "DiscordBGGBot/1.0"})
+        self.breaker = CircuitBreaker()
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self._response_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def is_degraded(self) -> bool:
+        """Whether BGG is being bypassed and answers may come from the cache."""
+        return self.breaker.state != CLOSED
+
+    def _cached_response(self, key: tuple) -> Optional[bytes]:
+        with self._cache_lock:
+            return self._response_cache.get(key)
+
+    def _cache_response(self, key: tuple, content: bytes):
+        with self._cache_lock:
+            self._response_cache[key] = content
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > DEGRADED_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
     def _make_request(
         self, endpoint: str, params: Optional[Dict] = None
     ) -> ElementTree.Element:
         """Make a request to the BGG API and return parsed XML"""
-        try:
-            response = self.session.get(f"{BGG_API_BASE}{endpoint}", params=params)
-            response.raise_for_status()
-            return ElementTree.fromstring(response.content)
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"BGG API request failed: {str(e)}")
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        with span("bgg.request", endpoint=endpoint) as request_span:
+            if not self.breaker.allow_request():
+                content = self._cached_response(key)
+                request_span.set("cache", "stale" if content else "unavailable")
+                if content is None:
+                    raise BGGUnavailableError(
+                        "BGG is currently unavailable and this answer isn't cached yet. "
+                        "Please try again later."
+                    )
+            else:
+                request_span.set("cache", "miss")
+                self.rate_limiter.wait()
+                start = time.monotonic()
+                try:
+                    response = self.session.get(
+                        f"{BGG_API_BASE}{endpoint}",
+                        params=params,
+                        timeout=REQUEST_TIMEOUT,
+                    )
+                    response.raise_for_status()
+                except requests.exceptions.RequestException as e:
+                    self.breaker.record_failure(time.monotonic() - start)
+                    raise Exception(f"BGG API request failed: {str(e)}")
+                self.breaker.record_success(time.monotonic() - start)
+                content = response.content
+                self._cache_response(key, content)
+            request_span.set("bytes", len(content))
+
+        with span("xml.parse", endpoint=endpoint):
+            return ElementTree.fromstring(content)
 
     def search_bgg(
         self, query: str, game_types: str = "boardgame,boardgameexpansion"
@@ -50,7 +128,50 @@ class BGGClient:
         if item is None:
             raise Exception("No game found with that ID")
 
-        return self._parse_thing_data(item)
+        with span("parse.thing"):
+            return self._parse_thing_data(item)
+
+    def fetch_things(self, item_ids: List[str], stats: bool = False) -> List[Dict]:
+        """Fetch detailed information about several games in batched requests"""
+        results = []
+        for start in range(0, len(item_ids), THING_BATCH_SIZE):
+            batch = item_ids[start : start + THING_BATCH_SIZE]
+            params = {"id": ",".join(batch), "stats": 1 if stats else 0}
+            root = self._make_request("thing", params)
+            with span("parse.thing", count=len(batch)):
+                results.extend(
+                    self._parse_thing_data(item) for item in root.findall("item")
+                )
+        return results
+
+    def fetch_families(self, family_ids: List[str]) -> List[Dict]:
+        """Fetch game families and the games linked to them in batched requests"""
+        results = []
+        for start in range(0, len(family_ids), THING_BATCH_SIZE):
+            batch = family_ids[start : start + THING_BATCH_SIZE]
+            root = self._make_request("family", {"id": ",".join(batch)})
+            with span("parse.family", count=len(batch)):
+                results.extend(
+                    {
+                        "id": item.get("id"),
+                        "type": item.get("type"),
+                        "name": item.find("name").get("value"),
+                        "links": self._parse_links(item),
+                    }
+                    for item in root.findall("item")
+                )
+        return results
+
+    def _parse_links(self, item: ElementTree.Element) -> List[Dict]:
+        return [
+            {
+                "type": link.get("type"),
+                "id": link.get("id"),
+                "value": link.get("value"),
+                "inbound": link.get("inbound") == "true",
+            }
+            for link in item.findall("link")
+        ]
 
     def _parse_thing_data(self, item: ElementTree.Element) -> Dict:
         """Parse detailed game information from XML"""
@@ -62,11 +183,17 @@ class BGGClient:
             "image": (
                 item.find("image").text if item.find("image") is not None else None
             ),
+            "thumbnail": (
+                item.find("thumbnail").text
+                if item.find("thumbnail") is not None
+                else None
+            ),
             "description": (
                 item.find("description").text
                 if item.find("description") is not None
                 else None
             ),
+            "links": self._parse_links(item),
         }
 
         if item.find("statistics") is not None:
@@ -1,21 +1,47 @@
+import time
+
+_import_start = time.perf_counter()
+
 import os
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
-from flask import Flask
+from flask import Flask, Response, abort, jsonify, request
+import hmac
+import math
 import threading  # Import threading for running bot in a separate thread
 import asyncio
+from pathlib import Path
+
+from src.startup import StartupTimer, needs_sync, save_sync_hash
+
+startup = StartupTimer(started_at=_import_start)
+startup.mark("imports", _import_start)
 
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 # Render provides the PORT environment variable
 PORT = int(os.getenv("PORT", 5000))  # Default to 5000 if PORT is not set
+# Enables GET /debug/profile when set; callers must send it as X-Profile-Token
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN")
+# gunicorn runs a single sync worker, so a capture blocks / and /status for its
+# whole length; longer captures go through the owner-only !bggprofile command
+MAX_HTTP_PROFILE_SECONDS = 15
+# Hash of the last command tree pushed to Discord, so restarts skip the sync
+# Lives in data/, which deployments mount as a volume so it survives redeploys
+COMMAND_TREE_HASH_FILE = Path(
+    os.getenv(
+        "COMMAND_TREE_HASH_FILE",
+        Path(__file__).parent.parent / "data" / "command_tree.sha256",
+    )
+)
 
 intents = discord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 
 app = Flask(__name__)
+_connect_start = time.perf_counter()
 
 
 @app.route("/")
@@ -24,19 +50,97 @@ def home():
     return "Discord bot is running!"
 
 
+@app.route("/status")
+def status():
+    """Reports BGG circuit breaker state for operators."""
+    cog = bot.get_cog("BggCommands")
+    if cog is None:
+        return jsonify({"ready": False}), 503
+    return jsonify(
+        {
+            "ready": bot.is_ready(),
+            "bgg_breaker": cog.bgg.breaker.snapshot(),
+            "resolver_cache": cog.resolver.stats(),
+            "link_graph_cache": cog.link_graph.stats(),
+        }
+    )
+
+
+@app.route("/debug/profile")
+def debug_profile():
+    """Profiles the bot's event-loop thread for ?seconds=N (sample or cprofile mode)."""
+    # Imported here so the profiler costs nothing unless a capture is requested
+    from src import profiling
+
+    if not PROFILE_TOKEN:
+        abort(404)
+    if not hmac.compare_digest(
+        request.headers.get("X-Profile-Token", ""), PROFILE_TOKEN
+    ):
+        abort(403)
+    if not bot.is_ready():
+        abort(503)
+
+    seconds = request.args.get("seconds", 10, type=float)
+    if not math.isfinite(seconds):
+        abort(400)
+    seconds = max(1.0, min(seconds, MAX_HTTP_PROFILE_SECONDS))
+    mode = request.args.get("mode", "sample")
+    if mode not in ("sample", "cprofile", "pstats"):
+        abort(400)
+    if not profiling.capture_lock.acquire(blocking=False):
+        return "A profile capture is already running.", 409
+    try:
+        if mode == "sample":
+            folded = profiling.sample_thread(bot_thread.ident, seconds)
+            return Response(folded, mimetype="text/plain")
+        profiler = profiling.profile_loop(bot.loop, seconds)
+        if mode == "pstats":
+            return Response(
+                profiling.dump_pstats(profiler),
+                mimetype="application/octet-stream",
+                headers={"Content-Disposition": "attachment; filename=bot.pstats"},
+            )
+        return Response(profiling.format_pstats(profiler), mimetype="text/plain")
+    finally:
+        profiling.capture_lock.release()
+
+
+async def sync_command_tree():
+    """Syncs slash commands only when their signatures changed since the last sync."""
+    try:
+        changed, tree_hash = needs_sync(bot.tree, COMMAND_TREE_HASH_FILE)
+        if not changed:
+            print("Command tree unchanged, skipping sync.")
+            return
+        synced = await bot.tree.sync()
+        save_sync_hash(COMMAND_TREE_HASH_FILE, tree_hash)
+        print(f"Synced {len(synced)} command(s).")
+    except Exception as e:
+        print(f"Failed to sync command tree: {e}")
+
+
 @bot.event
 async def on_ready():
     print(f"Logged in as {bot.user.name} (ID: {bot.user.id})")
     print("------")
-    # You might want to sync commands here if using app commands
-    # await bot.tree.sync()
+    # on_ready fires again after reconnects; only the first one is startup
+    if getattr(bot, "_startup_reported", False):
+        return
+    bot._startup_reported = True
+    startup.mark("connect", _connect_start)
+    with startup.phase("sync"):
+        await sync_command_tree()
+    print(startup.report())
     print("Bot is ready.")
 
 
 async def load_cogs():
     """Loads the bot's command cogs."""
     try:
-        await bot.load_extension("src.cogs.bgg_commands")
+        with startup.phase("cogs"):
+            await bot.load_extension("src.cogs.bgg_commands")
+            await bot.load_extension("src.cogs.admin_commands")
         print("Cogs loaded successfully.")
     except Exception as e:
         print(f"Failed to load cogs: {e}")
@@ -55,6 +159,8 @@ def run_bot_thread():
     # Start the bot (this is a blocking call)
     try:
         print("Starting Discord bot...")
+        global _connect_start
+        _connect_start = time.perf_counter()
         loop.run_until_complete(bot.start(TOKEN))
     except Exception as e:
         print(f"Error running bot in thread: {e}")
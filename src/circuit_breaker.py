@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Error-rate and latency circuit breaker for calls to an upstream service.
+
+    Outcomes of the last `window` seconds are tracked. Once at least
+    `min_calls` were made, the circuit opens when the failure rate or the
+    slow-call rate reaches its threshold. After `cooldown` seconds it goes
+    half-open and lets up to `half_open_max_calls` probes through at a time;
+    `half_open_successes` successful probes close it, any failure reopens it.
+    """
+
+    def __init__(
+        self,
+        window: float = 60.0,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        slow_call_rate: float = 0.5,
+        cooldown: float = 30.0,
+        half_open_max_calls: int = 1,
+        half_open_successes: int = 2,
+    ):
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.cooldown = cooldown
+        self.half_open_max_calls = half_open_max_calls
+        self.half_open_successes = half_open_successes
+
+        self._lock = threading.Lock()
+        self._calls = deque()  # (timestamp, succeeded, latency)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float):
+        if self._state == OPEN and now - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+    def _open(self, now: float):
+        self._state = OPEN
+        self._opened_at = now
+        self._times_opened += 1
+        self._calls.clear()
+
+    def _prune(self, now: float):
+        while self._calls and now - self._calls[0][0] > self.window:
+            self._calls.popleft()
+
+    def allow_request(self) -> bool:
+        """Returns whether a call may go upstream right now.
+
+        Every allowed call must be followed by record_success or record_failure.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN:
+                if self._probes_in_flight < self.half_open_max_calls:
+                    self._probes_in_flight += 1
+                    return True
+            return False
+
+    def record_success(self, latency: float):
+        with self._lock:
+            now = time.monotonic()
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if latency >= self.slow_call_seconds:
+                    self._open(now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_successes:
+                    self._state = CLOSED
+                return
+            self._record(now, True, latency)
+
+    def record_failure(self, latency: float):
+        with self._lock:
+            now = time.monotonic()
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._open(now)
+                return
+            self._record(now, False, latency)
+
+    def _record(self, now: float, succeeded: bool, latency: float):
+        self._calls.append((now, succeeded, latency))
+        self._prune(now)
+        if self._state != CLOSED or len(self._calls) < self.min_calls:
+            return
+        total = len(self._calls)
+        failures = sum(1 for _, ok, _ in self._calls if not ok)
+        slow = sum(1 for _, _, lat in self._calls if lat >= self.slow_call_seconds)
+        if failures / total >= self.failure_rate or slow / total >= self.slow_call_rate:
+            self._open(now)
+
+    def snapshot(self) -> Dict:
+        """Current breaker state and window statistics, for operators."""
+        with self._lock:
+            now = time.monotonic()
+            self._maybe_half_open(now)
+            self._prune(now)
+            total = len(self._calls)
+            failures = sum(1 for _, ok, _ in self._calls if not ok)
+            latencies = sorted(lat for _, _, lat in self._calls)
+            return {
+                "state": self._state,
+                "calls_in_window": total,
+                "failure_rate": failures / total if total else 0.0,
+                "p50_latency": latencies[total // 2] if total else None,
+                "max_latency": latencies[-1] if total else None,
+                "times_opened": self._times_opened,
+                "retry_in": (
+                    max(0.0, self.cooldown - (now - self._opened_at))
+                    if self._state == OPEN
+                    else None
+                ),
+            }
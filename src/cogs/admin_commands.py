@@ -0,0 +1,112 @@
+import discord
+from discord.ext import commands
+import asyncio
+import cProfile
+import io
+import os
+import threading
+import time
+from pathlib import Path
+
+from .. import profiling
+
+
+class AdminCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # Directory for per-command profiles; unset means per-command profiling is off
+        self.PROFILE_DIR = os.getenv("BGG_PROFILE_COMMANDS_DIR")
+        self._command_samplers = {}
+
+    async def cog_load(self):
+        # Listeners are only registered when enabled, so there is no idle overhead
+        if self.PROFILE_DIR:
+            Path(self.PROFILE_DIR).mkdir(parents=True, exist_ok=True)
+            self.bot.add_listener(self._start_command_profile, "on_command")
+            self.bot.add_listener(self._finish_command_profile, "on_command_completion")
+            self.bot.add_listener(self._finish_command_profile, "on_command_error")
+
+    async def cog_unload(self):
+        if self.PROFILE_DIR:
+            self.bot.remove_listener(self._start_command_profile, "on_command")
+            self.bot.remove_listener(
+                self._finish_command_profile, "on_command_completion"
+            )
+            self.bot.remove_listener(self._finish_command_profile, "on_command_error")
+
+    async def _start_command_profile(self, ctx: commands.Context):
+        """Starts sampling the event loop while a command runs."""
+        sampler = profiling.StackSampler(threading.get_ident())
+        sampler.start()
+        self._command_samplers[id(ctx)] = (sampler, time.perf_counter())
+
+    async def _finish_command_profile(self, ctx: commands.Context, *args):
+        """Writes the command's collapsed stacks to the profile directory.
+
+        Samples cover the whole event loop, so commands running at the same
+        time show up in each other's profiles.
+        """
+        entry = self._command_samplers.pop(id(ctx), None)
+        if entry is None:
+            return
+        sampler, started = entry
+        folded = sampler.stop()
+        name = (
+            ctx.command.qualified_name.replace(" ", "_") if ctx.command else "unknown"
+        )
+        path = Path(self.PROFILE_DIR) / f"{name}-{int(time.time() * 1000)}.folded"
+        path.write_text(folded)
+        print(f"Profiled {name} in {time.perf_counter() - started:.3f}s -> {path.name}")
+
+    @commands.command(name="bggprofile", hidden=True)
+    @commands.is_owner()
+    async def bgg_profile(
+        self, ctx: commands.Context, seconds: float = 10, mode: str = "sample"
+    ):
+        """Profiles the bot's event loop for N seconds (owner only).
+
+        `sample` returns collapsed stacks for flamegraph.pl / speedscope,
+        `cprofile` returns pstats text, `pstats` the binary pstats dump.
+        """
+        if mode not in ("sample", "cprofile", "pstats"):
+            await ctx.send("Mode must be `sample`, `cprofile` or `pstats`.")
+            return
+        seconds = max(1.0, min(seconds, profiling.MAX_PROFILE_SECONDS))
+        if not profiling.capture_lock.acquire(blocking=False):
+            await ctx.send("A profile capture is already running.")
+            return
+
+        try:
+            await ctx.send(f"Profiling the event loop for {seconds:.0f}s ({mode})...")
+            if mode == "sample":
+                sampler = profiling.StackSampler(threading.get_ident())
+                sampler.start()
+                await asyncio.sleep(seconds)
+                data = sampler.stop().encode("utf-8")
+                filename = "bot.folded"
+            else:
+                # This coroutine runs on the loop thread, so cProfile sees it
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    profiler.disable()
+                if mode == "pstats":
+                    data = profiling.dump_pstats(profiler)
+                    filename = "bot.pstats"
+                else:
+                    data = profiling.format_pstats(profiler).encode("utf-8")
+                    filename = "bot-pstats.txt"
+            await ctx.send(file=discord.File(io.BytesIO(data), filename=filename))
+
+        except Exception as e:
+            print(f"Error in bgg_profile: {e}")
+            await ctx.send(f"An error occurred while profiling: {str(e)}")
+        finally:
+            profiling.capture_lock.release()
+
+
+async def setup(bot: commands.Bot):
+    """Required setup function for discord.py cogs."""
+    await bot.add_cog(AdminCommands(bot))
@@ -1,20 +1,105 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from typing import Optional
+import asyncio
 import re
 import html
 import json
+import os
+import time
 from pathlib import Path
 
 from ..bgg_api import BGGClient
+from ..hot_feed import diff_hot_lists, has_changes
+from ..link_graph import EXPANSION_LINK, FAMILY_LINK, LinkGraph
+from ..resolver import QueryResolver, normalize_query
+from ..tracing import span, tracer
+
+DEGRADED_NOTICE = "BGG is degraded: showing cached data"
+# Below this many indexed games, /bggsimilar seeds the index from the hot list
+SIMILARITY_SEED_THRESHOLD = 50
+# Favorites store name/year/thumbnail; entries older than this are refreshed
+FAVORITE_REFRESH_AGE = 7 * 24 * 60 * 60
+FAVORITE_REFRESH_INTERVAL = 60 * 60
+# Upper bound on ids refreshed per run, to spread the load on BGG
+FAVORITE_REFRESH_LIMIT = 100
+# Most games accepted by one bggfav add, and concurrent lookups for bulk adds
+BULK_FAVORITES_LIMIT = 25
+BULK_RESOLVE_CONCURRENCY = 4
+HOT_FEED_INTERVAL = 30 * 60
+# Pause between channel posts so a large fan-out stays under Discord's limits
+HOT_FEED_SEND_DELAY = 0.25
+# Most entries of each kind listed in one update
+HOT_FEED_MAX_LINES = 10
+# Bounds on link walks: depth, total games fetched and games shown per family
+EXPANSION_DEPTH = 2
+EXPANSION_LIMIT = 100
+FAMILY_LIMIT = 60
+FAMILY_MEMBER_LIMIT = 10
 
 
 class BggCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.USER_DATA_FILE = Path(__file__).parent.parent / "user_data.json"
+        self.HOT_FEED_FILE = Path(__file__).parent.parent / "hot_feed.json"
         self._ensure_data_file_exists()
         self.bot = bot
         self.bgg = BGGClient()
+        # Shared by every command that accepts a game name or ID
+        self.resolver = QueryResolver(self.bgg)
+        self.link_graph = LinkGraph(self.bgg)
+        self._bgg_concurrency = asyncio.Semaphore(BULK_RESOLVE_CONCURRENCY)
+        # NumPy-backed subsystems are built on first use to keep startup fast
+        self._similarity = None
+        self._ranks = None
+        self._ranks_loaded = False
+        self._trace_tokens = {}
+
+    @property
+    def similarity(self):
+        """The similar-games index, created on first use."""
+        if self._similarity is None:
+            from ..similarity import SimilarityIndex
+
+            self._similarity = SimilarityIndex()
+        return self._similarity
+
+    @property
+    def ranks(self):
+        """The offline ranks store, or None if it hasn't been built."""
+        if not self._ranks_loaded:
+            # Offline ranks dump built with `python -m src.ranks_store`; optional
+            from ..ranks_store import RanksStore
+
+            self._ranks = RanksStore.open(
+                os.getenv(
+                    "BGG_RANKS_STORE", Path(__file__).parent.parent / "ranks_data"
+                )
+            )
+            self._ranks_loaded = True
+        return self._ranks
+
+    async def cog_before_invoke(self, ctx: commands.Context):
+        """Starts a (sampled) trace for every command invocation."""
+        if isinstance(ctx.command, commands.Group):
+            # Prefix groups run the hooks again for their subcommand; trace that
+            return
+        self._trace_tokens[id(ctx)] = tracer.start_trace(
+            ctx.command.qualified_name,
+            user_id=str(ctx.author.id),
+            slash=ctx.interaction is not None,
+        )
+
+    async def cog_after_invoke(self, ctx: commands.Context):
+        tracer.end_trace(self._trace_tokens.pop(id(ctx), None))
+
+    async def cog_command_error(self, ctx: commands.Context, error: Exception):
+        """Ends the trace of a failed command, which may skip the after hook."""
+        tracer.end_trace(
+            self._trace_tokens.pop(id(ctx), None), getattr(error, "original", error)
+        )
+        # Defining this handler silences discord.py's default error output
+        print(f"Error in {ctx.command}: {error}")
 
     def _ensure_data_file_exists(self):
         """Creates the user data file if it doesn't exist."""
@@ -26,7 +111,7 @@ class BggCommands(commands.Cog):
         """Loads the user data from the JSON file."""
         self._ensure_data_file_exists()
         try:
-            with open(self.USER_DATA_FILE, "r") as f:
+            with span("store.load"), open(self.USER_DATA_FILE, "r") as f:
                 return json.load(f)
         except (json.JSONDecodeError, FileNotFoundError):
             # Return empty dict if file is corrupted or missing
@@ -35,7 +120,23 @@ class BggCommands(commands.Cog):
     def _save_user_data(self, data: dict):
         """Saves the user data to the JSON file."""
         self._ensure_data_file_exists()
-        with open(self.USER_DATA_FILE, "w") as f:
+        with span("store.save"), open(self.USER_DATA_FILE, "w") as f:
+            json.dump(data, f, indent=4)
+
+    def _load_hot_feed(self) -> dict:
+        """Loads hot feed subscriptions and the last Hotness snapshot."""
+        try:
+            with span("store.load"), open(self.HOT_FEED_FILE, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            data = {}
+        data.setdefault("channels", [])
+        data.setdefault("snapshot", None)
+        return data
+
+    def _save_hot_feed(self, data: dict):
+        """Saves hot feed subscriptions and the last Hotness snapshot."""
+        with span("store.save"), open(self.HOT_FEED_FILE, "w") as f:
             json.dump(data, f, indent=4)
 
     def _clean_description(self, description: Optional[str]) -> str:
@@ -47,6 +148,90 @@ class BggCommands(commands.Cog):
         # Limit length for Discord embed display
         return (desc[:500] + "...") if len(desc) > 500 else desc
 
+    def _set_footer(self, embed: discord.Embed, text: str = ""):
+        """Sets the embed footer, flagging answers served while BGG is degraded."""
+        if self.bgg.is_degraded():
+            text = f"{text} | {DEGRADED_NOTICE}" if text else DEGRADED_NOTICE
+        if text:
+            embed.set_footer(text=text)
+
+    def _thing_from_ranks(self, game_id: str) -> Optional[dict]:
+        """Builds thing-shaped game data from the offline ranks store, if present."""
+        record = self.ranks.get(game_id) if self.ranks else None
+        if record is None:
+            return None
+        return {
+            "id": record["id"],
+            "name": record["name"],
+            "year": record["year"],
+            "image": None,
+            "description": None,
+            "stats": {
+                "average": str(record["average"]),
+                "weight": str(record["weight"]) if record["weight"] else None,
+                "users_rated": str(record["users_rated"]),
+                "ranks": (
+                    [{"name": "boardgame", "value": str(record["rank"])}]
+                    if record["rank"]
+                    else []
+                ),
+            },
+        }
+
+    def _build_info_embed(
+        self, game_data: dict, offline: bool = False
+    ) -> discord.Embed:
+        """Renders parsed thing data as the bgginfo embed."""
+        embed = discord.Embed(
+            title=f"{game_data.get('name', 'N/A')} ({game_data.get('year', 'N/A')})",
+            description=self._clean_description(game_data.get("description")),
+            color=discord.Color.blue(),
+            url=f"https://boardgamegeek.com/boardgame/{game_data['id']}",
+        )
+
+        if game_data.get("image"):
+            embed.set_thumbnail(url=game_data["image"])
+
+        if game_data.get("stats"):
+            stats = game_data["stats"]
+            avg_rating = (
+                f"{float(stats.get('average', 0)):.2f}"
+                if stats.get("average")
+                else "N/A"
+            )
+            avg_weight = (
+                f"{float(stats.get('weight', 0)):.2f}" if stats.get("weight") else "N/A"
+            )
+            users_rated = stats.get("users_rated", "N/A")
+
+            embed.add_field(name="Avg Rating", value=avg_rating, inline=True)
+            embed.add_field(name="Weight", value=avg_weight, inline=True)
+            embed.add_field(name="Users Rated", value=users_rated, inline=True)
+
+            if stats.get("ranks"):
+                ranks_str = ""
+                for rank in stats["ranks"]:
+                    if rank.get("value") and rank["value"] != "Not Ranked":
+                        rank_name = (
+                            rank.get(
+                                "name", "Overall"
+                            )  # Use friendly name for rank type
+                            .replace("boardgame", "")
+                            .capitalize()
+                        )
+                        if not rank_name:  # Handle empty name after replace
+                            rank_name = "Overall"
+                        ranks_str += f"{rank_name}: {rank['value']}\n"
+
+                if ranks_str:
+                    embed.add_field(name="Ranks", value=ranks_str.strip(), inline=False)
+
+        footer = f"BGG ID: {game_data['id']}"
+        if offline:
+            footer += " | From offline ranks data"
+        self._set_footer(embed, footer)
+        return embed
+
     @commands.hybrid_command(
         name="bgginfo", description="Get detailed information about a board game"
     )
@@ -54,76 +239,42 @@ class BggCommands(commands.Cog):
         """Get detailed information about a board game from BGG using ID or search query."""
         await ctx.defer()
         try:
-            game_id = None
-            if query.isdigit():
-                game_id = query
-            else:
-                results = self.bgg.search_bgg(query)
-                if not results:
-                    await ctx.send(
-                        "No games found matching your search query.", ephemeral=True
-                    )
-                    return
-                game_id = results[0]["id"]  # Use the ID of the first search result
-
-            if not game_id:
+            try:
+                resolved = await asyncio.to_thread(self.resolver.resolve, query)
+            except Exception:
+                # Searches fail during an outage; the offline dump knows names too
+                record = (
+                    await asyncio.to_thread(self.ranks.find, query)
+                    if self.ranks
+                    else None
+                )
+                if record is None:
+                    raise
+                resolved = {"id": record["id"]}
+            if resolved is None:
                 await ctx.send(
-                    "Could not determine a game ID from your query.", ephemeral=True
+                    "No games found matching your search query.", ephemeral=True
                 )
                 return
+            game_id = resolved["id"]
 
-            game_data = self.bgg.fetch_thing_data(game_id, stats=True)
-
-            embed = discord.Embed(
-                title=f"{game_data.get('name', 'N/A')} ({game_data.get('year', 'N/A')})",
-                description=self._clean_description(game_data.get("description")),
-                color=discord.Color.blue(),
-                url=f"https://boardgamegeek.com/boardgame/{game_data['id']}",
-            )
-
-            if game_data.get("image"):
-                embed.set_thumbnail(url=game_data["image"])
-
-            if game_data.get("stats"):
-                stats = game_data["stats"]
-                avg_rating = (
-                    f"{float(stats.get('average', 0)):.2f}"
-                    if stats.get("average")
-                    else "N/A"
-                )
-                avg_weight = (
-                    f"{float(stats.get('weight', 0)):.2f}"
-                    if stats.get("weight")
-                    else "N/A"
+            offline = False
+            try:
+                game_data = await asyncio.to_thread(
+                    self.bgg.fetch_thing_data, game_id, stats=True
                 )
-                users_rated = stats.get("users_rated", "N/A")
-
-                embed.add_field(name="Avg Rating", value=avg_rating, inline=True)
-                embed.add_field(name="Weight", value=avg_weight, inline=True)
-                embed.add_field(name="Users Rated", value=users_rated, inline=True)
-
-                if stats.get("ranks"):
-                    ranks_str = ""
-                    for rank in stats["ranks"]:
-                        if rank.get("value") and rank["value"] != "Not Ranked":
-                            rank_name = (
-                                rank.get(
-                                    "name", "Overall"
-                                )  # Use friendly name for rank type
-                                .replace("boardgame", "")
-                                .capitalize()
-                            )
-                            if not rank_name:  # Handle empty name after replace
-                                rank_name = "Overall"
-                            ranks_str += f"{rank_name}: {rank['value']}\n"
-
-                    if ranks_str:
-                        embed.add_field(
-                            name="Ranks", value=ranks_str.strip(), inline=False
-                        )
+                self.similarity.add_game(game_data)
+            except Exception:
+                # Fall back to the offline ranks dump when BGG can't answer
+                game_data = self._thing_from_ranks(game_id)
+                if game_data is None:
+                    raise
+                offline = True
 
-            embed.set_footer(text=f"BGG ID: {game_data['id']}")
-            await ctx.send(embed=embed)
+            with span("render"):
+                embed = self._build_info_embed(game_data, offline)
+            with span("discord.send"):
+                await ctx.send(embed=embed)
 
         except Exception as e:
             print(f"Error in bgg_info: {e}")
@@ -138,7 +289,7 @@ class BggCommands(commands.Cog):
         """Searches BGG for games matching the query."""
         await ctx.defer()
         try:
-            results = self.bgg.search_bgg(query)
+            results = await asyncio.to_thread(self.bgg.search_bgg, query)
             if not results:
                 await ctx.send("No games found matching your search.", ephemeral=True)
                 return
@@ -156,8 +307,11 @@ class BggCommands(commands.Cog):
             response_lines.append(
                 "\nUse `!bgginfo <ID>` or `!bgginfo <Name>` for more details."
             )
+            if self.bgg.is_degraded():
+                response_lines.append(f"*{DEGRADED_NOTICE}*")
 
-            await ctx.send("\n".join(response_lines))
+            with span("discord.send"):
+                await ctx.send("\n".join(response_lines))
 
         except Exception as e:
             print(f"Error in bgg_search: {e}")
@@ -173,7 +327,7 @@ class BggCommands(commands.Cog):
         """Displays the current BGG Top 10 Hotness list with stats."""
         await ctx.defer()
         try:
-            hot_items = self.bgg.fetch_hot_items()
+            hot_items = await asyncio.to_thread(self.bgg.fetch_hot_items)
             if not hot_items:
                 await ctx.send(
                     "Could not retrieve the BGG Hotness list.", ephemeral=True
@@ -189,7 +343,10 @@ class BggCommands(commands.Cog):
             description_lines = []
             for item in top_10_items:
                 try:
-                    detail_data = self.bgg.fetch_thing_data(item["id"], stats=True)
+                    detail_data = await asyncio.to_thread(
+                        self.bgg.fetch_thing_data, item["id"], stats=True
+                    )
+                    self.similarity.add_game(detail_data)
                     stats = detail_data.get("stats", {})
                     avg_rating = (
                         f"{float(stats.get('average', 0)):.2f}"
@@ -219,7 +376,9 @@ class BggCommands(commands.Cog):
                     )
 
             embed.description = "\n\n".join(description_lines)
-            await ctx.send(embed=embed)
+            self._set_footer(embed)
+            with span("discord.send"):
+                await ctx.send(embed=embed)
 
         except Exception as e:
             print(f"Error in bgg_hot: {e}")
@@ -235,25 +394,17 @@ class BggCommands(commands.Cog):
         """Displays the cover image for a game found by ID or search query."""
         await ctx.defer()
         try:
-            game_id = None
-            if query.isdigit():
-                game_id = query
-            else:
-                results = self.bgg.search_bgg(query)
-                if not results:
-                    await ctx.send(
-                        "No games found matching your search query.", ephemeral=True
-                    )
-                    return
-                game_id = results[0]["id"]  # Use the ID of the first search result
-
-            if not game_id:
+            resolved = await asyncio.to_thread(self.resolver.resolve, query)
+            if resolved is None:
                 await ctx.send(
-                    "Could not determine a game ID from your query.", ephemeral=True
+                    "No games found matching your search query.", ephemeral=True
                 )
                 return
+            game_id = resolved["id"]
 
-            game_data = self.bgg.fetch_thing_data(game_id, stats=False)
+            game_data = await asyncio.to_thread(
+                self.bgg.fetch_thing_data, game_id, stats=False
+            )
 
             if game_data.get("image"):
                 embed = discord.Embed(
@@ -262,8 +413,9 @@ class BggCommands(commands.Cog):
                     url=f"https://boardgamegeek.com/boardgame/{game_data['id']}",
                 )
                 embed.set_image(url=game_data["image"])
-                embed.set_footer(text=f"BGG ID: {game_data['id']}")
-                await ctx.send(embed=embed)
+                self._set_footer(embed, f"BGG ID: {game_data['id']}")
+                with span("discord.send"):
+                    await ctx.send(embed=embed)
             else:
                 await ctx.send(f"No image found for game ID {game_id}.", ephemeral=True)
 
@@ -274,8 +426,558 @@ class BggCommands(commands.Cog):
                 ephemeral=True,
             )
 
+    @commands.hybrid_command(
+        name="bggsimilar",
+        description="Find games similar to a board game by mechanics, designers and weight",
+    )
+    async def bgg_similar(self, ctx: commands.Context, *, query: str):
+        """Lists games similar to the one found by ID or search query."""
+        await ctx.defer()
+        try:
+            resolved = await asyncio.to_thread(self.resolver.resolve, query)
+            if resolved is None:
+                await ctx.send(
+                    "No games found matching your search query.", ephemeral=True
+                )
+                return
+            game_id = resolved["id"]
+
+            game_data = await asyncio.to_thread(
+                self.bgg.fetch_thing_data, game_id, stats=True
+            )
+            self.similarity.add_game(game_data)
+
+            if len(self.similarity) < SIMILARITY_SEED_THRESHOLD:
+                # Too few games to compare against; seed with the hot list in
+                # batched requests rather than one request per game
+                hot_items = await asyncio.to_thread(self.bgg.fetch_hot_items)
+                hot_ids = [item["id"] for item in hot_items]
+                hot_games = await asyncio.to_thread(
+                    self.bgg.fetch_things, hot_ids, stats=True
+                )
+                for hot_game in hot_games:
+                    self.similarity.add_game(hot_game)
+
+            with span("similarity.query", indexed=len(self.similarity)):
+                similar = self.similarity.most_similar(game_data["id"], k=10)
+            if not similar:
+                await ctx.send(
+                    f"No similar games found for '{game_data.get('name', game_id)}' yet.",
+                    ephemeral=True,
+                )
+                return
+
+            embed = discord.Embed(
+                title=f"Games similar to {game_data.get('name', 'N/A')}",
+                color=discord.Color.teal(),
+                url=f"https://boardgamegeek.com/boardgame/{game_data['id']}",
+            )
+            description_lines = []
+            for i, (game, score) in enumerate(similar):
+                year_str = f"({game['year']})" if game.get("year") else ""
+                description_lines.append(
+                    f"{i+1}. [{game['name']}](https://boardgamegeek.com/boardgame/{game['id']}) {year_str}"
+                    f" - {score:.0%} match"
+                )
+            embed.description = "\n".join(description_lines)
+            self._set_footer(
+                embed, f"Compared against {len(self.similarity)} cached games"
+            )
+            with span("discord.send"):
+                await ctx.send(embed=embed)
+
+        except Exception as e:
+            print(f"Error in bgg_similar: {e}")
+            await ctx.send(
+                f"An error occurred while finding similar games: {str(e)}",
+                ephemeral=True,
+            )
+
+    @commands.hybrid_command(
+        name="bggtop",
+        description="Show top ranked or top rated games from the offline ranks data",
+    )
+    async def bgg_top(
+        self,
+        ctx: commands.Context,
+        count: int = 10,
+        sort: str = "rank",
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        max_weight: Optional[float] = None,
+    ):
+        """Lists the top games by rank or rating without calling the BGG API."""
+        if self.ranks is None:
+            await ctx.send("Offline ranks data is not available.", ephemeral=True)
+            return
+        if sort not in ("rank", "rating"):
+            await ctx.send("Sort must be `rank` or `rating`.", ephemeral=True)
+            return
+        if max_weight is not None and not self.ranks.has_weights:
+            await ctx.send(
+                "Weight data isn't in the loaded ranks dump, so `max_weight` can't be used.",
+                ephemeral=True,
+            )
+            return
+
+        try:
+            count = max(1, min(count, 25))
+            filters = {
+                "year_from": year_from,
+                "year_to": year_to,
+                "max_weight": max_weight,
+            }
+            if sort == "rank":
+                games = self.ranks.top_by_rank(count, **filters)
+            else:
+                # Require a meaningful number of ratings so obscure games don't dominate
+                games = self.ranks.top_by_rating(count, min_users_rated=1000, **filters)
+
+            if not games:
+                await ctx.send("No games match those filters.", ephemeral=True)
+                return
+
+            embed = discord.Embed(
+                title=f"BGG Top {len(games)} by {sort.capitalize()}",
+                color=discord.Color.gold(),
+            )
+            description_lines = []
+            for i, game in enumerate(games):
+                year_str = f"({game['year']})" if game.get("year") else ""
+                rank_str = f"#{game['rank']}" if game.get("rank") else "Unranked"
+                description_lines.append(
+                    f"{i+1}. [{game['name']}](https://boardgamegeek.com/boardgame/{game['id']}) {year_str}\n"
+                    f"   {rank_str}, Rating: {game['average']:.2f}, Users Rated: {game['users_rated']}"
+                )
+            embed.description = "\n".join(description_lines)
+            embed.set_footer(text="From offline ranks data")
+            with span("discord.send"):
+                await ctx.send(embed=embed)
+
+        except Exception as e:
+            print(f"Error in bgg_top: {e}")
+            await ctx.send(
+                f"An error occurred while listing top games: {str(e)}", ephemeral=True
+            )
+
+    # --- Expansions and Families --- #
+
+    def _game_line(self, game: dict) -> str:
+        year_str = f" ({game['year']})" if game.get("year") else ""
+        return f"[{game['name']}](https://boardgamegeek.com/boardgame/{game['id']}){year_str}"
+
+    def _fit_lines(self, lines: list, limit: int) -> str:
+        """Joins as many lines as fit in `limit` characters, noting the rest."""
+        text = ""
+        for i, line in enumerate(lines):
+            more = f"\n...and {len(lines) - i} more"
+            if len(text) + len(line) + 1 + len(more) > limit:
+                return text + more
+            text = f"{text}\n{line}" if text else line
+        return text
+
+    @commands.hybrid_command(
+        name="bggexpansions",
+        description="List the expansions of a board game",
+    )
+    async def bgg_expansions(self, ctx: commands.Context, *, query: str):
+        """Lists the expansions of the game found by ID or search query."""
+        await ctx.defer()
+        try:
+            resolved = await asyncio.to_thread(self.resolver.resolve, query)
+            if resolved is None:
+                await ctx.send(
+                    "No games found matching your search query.", ephemeral=True
+                )
+                return
+
+            graph = await asyncio.to_thread(
+                self.link_graph.walk,
+                resolved["id"],
+                [EXPANSION_LINK],
+                max_depth=EXPANSION_DEPTH,
+                max_nodes=EXPANSION_LIMIT,
+            )
+            if graph is None:
+                await ctx.send("No game found with that ID.", ephemeral=True)
+                return
+            game = graph["root"]
+            if not graph["levels"]:
+                await ctx.send(
+                    f"'{game['name']}' has no expansions on BGG.", ephemeral=True
+                )
+                return
+
+            with span("render"):
+                children = {}
+                for level in graph["levels"][1:]:
+                    for entry in level:
+                        children.setdefault(entry["parent"]["id"], []).append(
+                            entry["node"]
+                        )
+                lines = []
+
+                def add_children(parent, indent):
+                    # Deeper levels are shown indented under their parent
+                    for child in children.get(parent["id"], []):
+                        lines.append(f"{'  ' * indent}↳ {self._game_line(child)}")
+                        add_children(child, indent + 1)
+
+                for i, entry in enumerate(graph["levels"][0]):
+                    lines.append(f"{i+1}. {self._game_line(entry['node'])}")
+                    add_children(entry["node"], 1)
+
+                embed = discord.Embed(
+                    title=f"Expansions for {game['name']}",
+                    color=discord.Color.dark_green(),
+                    url=f"https://boardgamegeek.com/boardgame/{game['id']}",
+                    description=self._fit_lines(lines, 4096),
+                )
+                if game.get("thumbnail"):
+                    embed.set_thumbnail(url=game["thumbnail"])
+                count = sum(len(level) for level in graph["levels"])
+                footer = f"{count} expansions"
+                if graph["truncated"]:
+                    footer += f" (stopped at {EXPANSION_LIMIT})"
+                self._set_footer(embed, footer)
+            with span("discord.send"):
+                await ctx.send(embed=embed)
+
+        except Exception as e:
+            print(f"Error in bgg_expansions: {e}")
+            await ctx.send(
+                f"An error occurred while fetching expansions: {str(e)}",
+                ephemeral=True,
+            )
+
+    @commands.hybrid_command(
+        name="bggfamily",
+        description="Show the families a board game belongs to and their other games",
+    )
+    async def bgg_family(self, ctx: commands.Context, *, query: str):
+        """Lists the families of the game found by ID or search query."""
+        await ctx.defer()
+        try:
+            resolved = await asyncio.to_thread(self.resolver.resolve, query)
+            if resolved is None:
+                await ctx.send(
+                    "No games found matching your search query.", ephemeral=True
+                )
+                return
+
+            graph = await asyncio.to_thread(
+                self.link_graph.walk,
+                resolved["id"],
+                [FAMILY_LINK],
+                max_depth=2,
+                max_nodes=FAMILY_LIMIT,
+                max_per_node=FAMILY_MEMBER_LIMIT,
+            )
+            if graph is None:
+                await ctx.send("No game found with that ID.", ephemeral=True)
+                return
+            game = graph["root"]
+            if not graph["levels"]:
+                await ctx.send(
+                    f"'{game['name']}' isn't part of any family on BGG.",
+                    ephemeral=True,
+                )
+                return
+
+            with span("render"):
+                members = {}
+                for level in graph["levels"][1:]:
+                    for entry in level:
+                        members.setdefault(entry["parent"]["id"], []).append(
+                            entry["node"]
+                        )
+
+                embed = discord.Embed(
+                    title=f"Families of {game['name']}",
+                    color=discord.Color.dark_teal(),
+                    url=f"https://boardgamegeek.com/boardgame/{game['id']}",
+                )
+                # Discord allows at most 25 fields per embed
+                for entry in graph["levels"][0][:25]:
+                    family = entry["node"]
+                    lines = [
+                        self._game_line(member)
+                        for member in members.get(family["id"], [])
+                    ]
+                    embed.add_field(
+                        name=family["name"][:256],
+                        value=self._fit_lines(lines, 1024) or "No other games",
+                        inline=False,
+                    )
+                if game.get("thumbnail"):
+                    embed.set_thumbnail(url=game["thumbnail"])
+                self._set_footer(
+                    embed,
+                    "Some families are shortened" if graph["truncated"] else "",
+                )
+            with span("discord.send"):
+                await ctx.send(embed=embed)
+
+        except Exception as e:
+            print(f"Error in bgg_family: {e}")
+            await ctx.send(
+                f"An error occurred while fetching families: {str(e)}",
+                ephemeral=True,
+            )
+
+    # --- Hotness Feed --- #
+
+    def _render_hot_update(self, diff: dict, details: dict) -> discord.Embed:
+        """Builds the single embed posted to every subscribed channel."""
+
+        def link(item):
+            year_str = f" ({item['year']})" if item.get("year") else ""
+            return f"[{item['name']}](https://boardgamegeek.com/boardgame/{item['id']}){year_str}"
+
+        embed = discord.Embed(title="BGG Hotness Update", color=discord.Color.orange())
+        if diff["entered"]:
+            lines = []
+            for item in diff["entered"][:HOT_FEED_MAX_LINES]:
+                stats = details.get(item["id"], {}).get("stats") or {}
+                rating = (
+                    f"{float(stats['average']):.2f}" if stats.get("average") else "N/A"
+                )
+                weight = (
+                    f"{float(stats['weight']):.2f}" if stats.get("weight") else "N/A"
+                )
+                lines.append(
+                    f"**#{item['rank']}** {link(item)} - Rating: {rating}, Weight: {weight}"
+                )
+            embed.add_field(
+                name="New on the list",
+                value=self._fit_lines(lines, 1024),
+                inline=False,
+            )
+        if diff["moved"]:
+            lines = [
+                f"{'⬆' if new < old else '⬇'} #{old} → #{new} {link(item)}"
+                for item, old, new in diff["moved"][:HOT_FEED_MAX_LINES]
+            ]
+            embed.add_field(
+                name="Big moves", value=self._fit_lines(lines, 1024), inline=False
+            )
+        if diff["left"]:
+            lines = [link(item) for item in diff["left"][:HOT_FEED_MAX_LINES]]
+            embed.add_field(
+                name="Dropped off", value=self._fit_lines(lines, 1024), inline=False
+            )
+        return embed
+
+    async def _post_to_channel(self, channel_id: int, embed: discord.Embed) -> bool:
+        """Posts the update to one channel; returns False if the channel is gone."""
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            # Missing from the cache isn't missing from Discord, e.g. before
+            # the guild is available after a restart; ask the API to be sure
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except (discord.NotFound, discord.Forbidden):
+                return False
+            except discord.HTTPException as e:
+                print(f"Error fetching hot feed channel {channel_id}: {e}")
+                return True
+        for attempt in range(2):
+            try:
+                await channel.send(embed=embed)
+                return True
+            except discord.Forbidden:
+                return False
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt:
+                    print(f"Error posting hot feed to {channel_id}: {e}")
+                    return True
+                # Back off for the rate limit, then retry once
+                await asyncio.sleep(getattr(e, "retry_after", 5))
+        return True
+
+    @tasks.loop(seconds=HOT_FEED_INTERVAL)
+    async def poll_hot_feed(self):
+        """Snapshots the Hotness list once for all channels and posts the diff."""
+        try:
+            feed = self._load_hot_feed()
+            if not feed["channels"]:
+                return
+
+            current = await asyncio.to_thread(self.bgg.fetch_hot_items)
+            if not current:
+                # An empty list is a BGG hiccup, not a baseline to diff against
+                return
+            previous = feed["snapshot"]
+            feed["snapshot"] = current
+            if not previous:
+                # First snapshot only sets the baseline
+                self._save_hot_feed(feed)
+                return
+            diff = diff_hot_lists(previous, current)
+            if not has_changes(diff):
+                self._save_hot_feed(feed)
+                return
+
+            # One batched request for every newly entered game
+            entered_ids = [item["id"] for item in diff["entered"]]
+            details = {}
+            if entered_ids:
+                try:
+                    games = await asyncio.to_thread(
+                        self.bgg.fetch_things, entered_ids, True
+                    )
+                    details = {game["id"]: game for game in games}
+                    for game in games:
+                        self.similarity.add_game(game)
+                except Exception as detail_e:
+                    print(f"Error fetching details for hot feed: {detail_e}")
+
+            embed = self._render_hot_update(diff, details)
+            self._set_footer(embed)
+            gone = []
+            for channel_id in list(feed["channels"]):
+                if not await self._post_to_channel(channel_id, embed):
+                    gone.append(channel_id)
+                await asyncio.sleep(HOT_FEED_SEND_DELAY)
+
+            # Reload so (un)subscriptions made while posting aren't lost
+            latest = self._load_hot_feed()
+            latest["channels"] = [c for c in latest["channels"] if c not in gone]
+            latest["snapshot"] = current
+            self._save_hot_feed(latest)
+        except Exception as e:
+            print(f"Error in hot feed: {e}")
+
+    @poll_hot_feed.before_loop
+    async def before_poll_hot_feed(self):
+        await self.bot.wait_until_ready()
+
+    @commands.hybrid_group(
+        name="bgghotfeed", description="Post BGG Hotness changes to this channel"
+    )
+    @commands.guild_only()
+    async def bgghotfeed(self, ctx: commands.Context):
+        """Group command for managing the Hotness feed."""
+        if ctx.invoked_subcommand is None:
+            await ctx.send(
+                "Invalid bgghotfeed command. Use `subscribe` or `unsubscribe`.",
+                ephemeral=True,
+            )
+
+    @bgghotfeed.command(
+        name="subscribe", description="Post Hotness changes in this channel"
+    )
+    @commands.has_permissions(manage_channels=True)
+    async def bgghotfeed_subscribe(self, ctx: commands.Context):
+        """Subscribes the current channel to Hotness updates."""
+        feed = self._load_hot_feed()
+        if ctx.channel.id in feed["channels"]:
+            await ctx.send("This channel is already subscribed.", ephemeral=True)
+            return
+        feed["channels"].append(ctx.channel.id)
+        self._save_hot_feed(feed)
+        await ctx.send(
+            f"Subscribed! Hotness changes will be posted here every "
+            f"{HOT_FEED_INTERVAL // 60} minutes when the list changes.",
+            ephemeral=True,
+        )
+
+    @bgghotfeed.command(
+        name="unsubscribe", description="Stop posting Hotness changes in this channel"
+    )
+    @commands.has_permissions(manage_channels=True)
+    async def bgghotfeed_unsubscribe(self, ctx: commands.Context):
+        """Unsubscribes the current channel from Hotness updates."""
+        feed = self._load_hot_feed()
+        if ctx.channel.id not in feed["channels"]:
+            await ctx.send("This channel is not subscribed.", ephemeral=True)
+            return
+        feed["channels"].remove(ctx.channel.id)
+        self._save_hot_feed(feed)
+        await ctx.send("Unsubscribed from Hotness updates.", ephemeral=True)
+
     # --- User Favorites Commands --- #
 
+    def _favorite_entry(self, game: dict) -> dict:
+        """Builds the stored favorite record from thing data or a search result."""
+        return {
+            "id": game["id"],
+            "name": game.get("name"),
+            "year": game.get("year"),
+            "thumbnail": game.get("thumbnail"),
+            "updated_at": time.time(),
+        }
+
+    def _get_favorites(self, user_data: dict, user_id: str) -> list:
+        """Returns the user's favorites list, creating it and upgrading bare IDs."""
+        user = user_data.setdefault(user_id, {})
+        favorites = user.setdefault("favorites", [])
+        for i, favorite in enumerate(favorites):
+            if isinstance(favorite, str):
+                # Older entries only stored the ID; the refresh job fills them in
+                favorites[i] = {
+                    "id": favorite,
+                    "name": None,
+                    "year": None,
+                    "thumbnail": None,
+                    "updated_at": 0,
+                }
+        return favorites
+
+    async def cog_load(self):
+        self.refresh_favorites.start()
+        self.poll_hot_feed.start()
+
+    async def cog_unload(self):
+        self.refresh_favorites.cancel()
+        self.poll_hot_feed.cancel()
+
+    @tasks.loop(seconds=FAVORITE_REFRESH_INTERVAL)
+    async def refresh_favorites(self):
+        """Refreshes stale or incomplete favorites in batched thing requests."""
+        if self.bgg.is_degraded():
+            return
+        try:
+            user_data = self._load_user_data()
+            cutoff = time.time() - FAVORITE_REFRESH_AGE
+            # Incomplete entries are stored with updated_at=0, so they count as stale
+            stale = {}
+            for user_id in user_data:
+                for favorite in self._get_favorites(user_data, user_id):
+                    if favorite["updated_at"] < cutoff:
+                        stale[favorite["id"]] = min(
+                            favorite["updated_at"],
+                            stale.get(favorite["id"], favorite["updated_at"]),
+                        )
+            if not stale:
+                return
+
+            # Oldest first, so nothing is starved by the per-run limit
+            stale_ids = sorted(stale, key=stale.get)[:FAVORITE_REFRESH_LIMIT]
+            games = await asyncio.to_thread(self.bgg.fetch_things, stale_ids)
+            refreshed = {game["id"]: self._favorite_entry(game) for game in games}
+            # IDs BGG no longer returns wait a full refresh period before retrying
+            missing = set(stale_ids) - set(refreshed)
+            now = time.time()
+
+            # Reload so favorites changed while we were fetching aren't lost
+            user_data = self._load_user_data()
+            for user_id in user_data:
+                favorites = self._get_favorites(user_data, user_id)
+                for i, favorite in enumerate(favorites):
+                    if favorite["id"] in refreshed:
+                        favorites[i] = refreshed[favorite["id"]]
+                    elif favorite["id"] in missing:
+                        favorite["updated_at"] = now
+            self._save_user_data(user_data)
+            print(f"Refreshed {len(refreshed)} favorite game(s).")
+        except Exception as e:
+            print(f"Error refreshing favorites: {e}")
+
+    @refresh_favorites.before_loop
+    async def before_refresh_favorites(self):
+        await self.bot.wait_until_ready()
+
     @commands.hybrid_group(name="bggfav", description="Manage your favorite BGG games")
     async def bggfav(self, ctx: commands.Context):
         """Group command for managing BGG favorites."""
@@ -285,61 +987,113 @@ class BggCommands(commands.Cog):
                 ephemeral=True,
             )
 
-    @bggfav.command(name="add", description="Add a game to your favorites list")
+    def _split_entries(self, text: str) -> list:
+        """Splits a comma- or newline-separated list of games, dropping repeats."""
+        entries = []
+        for entry in re.split(r"[,\n]", text):
+            entry = entry.strip()
+            if entry and entry not in entries:
+                entries.append(entry)
+        return entries
+
+    async def _resolve_names(self, names: list) -> dict:
+        """Resolves names concurrently; values are results or the raised exception."""
+
+        async def resolve(name):
+            async with self._bgg_concurrency:
+                return await asyncio.to_thread(self.resolver.resolve, name)
+
+        # "Wingspan" and "wingspan " share one lookup instead of racing
+        unique = {}
+        for name in names:
+            unique.setdefault(normalize_query(name), name)
+        results = await asyncio.gather(
+            *(resolve(name) for name in unique.values()), return_exceptions=True
+        )
+        by_key = dict(zip(unique, results))
+        return {name: by_key[normalize_query(name)] for name in names}
+
+    async def _send_summary(self, ctx: commands.Context, lines: list):
+        """Sends one line as-is, or several as a bulleted per-item summary."""
+        if len(lines) == 1:
+            await ctx.send(lines[0], ephemeral=True)
+            return
+        summary = "\n".join(f"- {line}" for line in lines)
+        if len(summary) > 2000:  # Discord message limit
+            summary = summary[:1990].rsplit("\n", 1)[0] + "\n- ..."
+        await ctx.send(summary, ephemeral=True)
+
+    @bggfav.command(name="add", description="Add games to your favorites list")
     async def bggfav_add(self, ctx: commands.Context, *, query: str):
-        """Adds a game (by ID or name search) to your favorites."""
+        """Adds games (by ID or name, comma or newline separated) to your favorites."""
         await ctx.defer(ephemeral=True)
         user_id = str(ctx.author.id)
-        game_id = None
-        game_name = "Unknown Game"
 
-        try:
-            # Resolve query to game ID first
-            if query.isdigit():
-                game_id = query
-                try:  # Fetch name for confirmation message if ID provided
-                    game_data = self.bgg.fetch_thing_data(game_id, stats=False)
-                    game_name = game_data.get("name", game_name)
-                except Exception:
-                    await ctx.send(
-                        f"Could not verify game ID '{query}'. Please ensure it's a valid BGG ID.",
-                        ephemeral=True,
-                    )
-                    return
-            else:
-                results = self.bgg.search_bgg(query)
-                if not results:
-                    await ctx.send(
-                        f"No games found matching '{query}'.", ephemeral=True
-                    )
-                    return
-                game_id = results[0]["id"]
-                game_name = results[0].get("name", game_name)
+        entries = self._split_entries(query)
+        if not entries:
+            await ctx.send("Please provide at least one game.", ephemeral=True)
+            return
+        if len(entries) > BULK_FAVORITES_LIMIT:
+            await ctx.send(
+                f"You can add up to {BULK_FAVORITES_LIMIT} games at once.",
+                ephemeral=True,
+            )
+            return
 
-            if not game_id:
-                await ctx.send(
-                    "Could not determine a game ID from your query.", ephemeral=True
-                )
-                return
+        try:
+            # IDs are validated with one batched thing request
+            ids = [entry for entry in entries if entry.isdigit()]
+            games_by_id = {}
+            if ids:
+                try:
+                    games = await asyncio.to_thread(self.bgg.fetch_things, ids)
+                    games_by_id = {game["id"]: game for game in games}
+                except Exception as fetch_e:
+                    print(f"Error verifying favorite IDs {ids}: {fetch_e}")
+            # Names are searched concurrently (cached ones never reach BGG)
+            names = [entry for entry in entries if not entry.isdigit()]
+            resolved_names = await self._resolve_names(names) if names else {}
 
+            # Everything is resolved, so the store is read and written once
             user_data = self._load_user_data()
-            if user_id not in user_data:
-                user_data[user_id] = {"favorites": []}
-            elif "favorites" not in user_data[user_id]:
-                user_data[user_id]["favorites"] = []
+            favorites = self._get_favorites(user_data, user_id)
+            lines = []
+            added = False
+            for entry in entries:
+                if entry.isdigit():
+                    game = games_by_id.get(entry)
+                    if game is None:
+                        lines.append(
+                            f"Could not verify game ID '{entry}'. Please ensure it's a valid BGG ID."
+                        )
+                        continue
+                else:
+                    game = resolved_names[entry]
+                    if isinstance(game, Exception):
+                        lines.append(f"Could not look up '{entry}': {game}")
+                        continue
+                    if game is None:
+                        lines.append(f"No games found matching '{entry}'.")
+                        continue
 
-            if game_id not in user_data[user_id]["favorites"]:
-                user_data[user_id]["favorites"].append(game_id)
+                game_id = game["id"]
+                game_name = game.get("name") or "Unknown Game"
+                if any(favorite["id"] == game_id for favorite in favorites):
+                    lines.append(
+                        f"'{game_name}' (ID: {game_id}) is already in your favorites."
+                    )
+                    continue
+                favorite = self._favorite_entry(game)
+                if not entry.isdigit():
+                    # Search results carry no thumbnail; let the refresh job fetch it
+                    favorite["updated_at"] = 0
+                favorites.append(favorite)
+                added = True
+                lines.append(f"Added '{game_name}' (ID: {game_id}) to your favorites.")
+
+            if added:
                 self._save_user_data(user_data)
-                await ctx.send(
-                    f"Added '{game_name}' (ID: {game_id}) to your favorites.",
-                    ephemeral=True,
-                )
-            else:
-                await ctx.send(
-                    f"'{game_name}' (ID: {game_id}) is already in your favorites.",
-                    ephemeral=True,
-                )
+            await self._send_summary(ctx, lines)
 
         except Exception as e:
             print(f"Error in bggfav_add: {e}")
@@ -347,50 +1101,64 @@ class BggCommands(commands.Cog):
                 f"An error occurred while adding the favorite: {str(e)}", ephemeral=True
             )
 
-    @bggfav.command(name="remove", description="Remove a game from your favorites list")
-    async def bggfav_remove(self, ctx: commands.Context, game_id: str):
-        """Removes a game (by ID) from your favorites."""
+    @bggfav.command(name="remove", description="Remove games from your favorites list")
+    async def bggfav_remove(self, ctx: commands.Context, *, games: str):
+        """Removes games (by ID or name, comma or newline separated) from your favorites."""
         await ctx.defer(ephemeral=True)
         user_id = str(ctx.author.id)
 
-        if not game_id.isdigit():
+        entries = self._split_entries(games)
+        if not entries:
             await ctx.send(
-                "Please provide the BGG Game ID (a number) to remove.", ephemeral=True
+                "Please provide the BGG Game ID or name to remove.", ephemeral=True
             )
             return
 
         try:
             user_data = self._load_user_data()
+            favorites = self._get_favorites(user_data, user_id)
 
-            if (
-                user_id not in user_data
-                or "favorites" not in user_data[user_id]
-                or not user_data[user_id]["favorites"]
-            ):
+            if not favorites:
                 await ctx.send(
                     "You don't have any favorites saved yet.", ephemeral=True
                 )
                 return
 
-            if game_id in user_data[user_id]["favorites"]:
-                user_data[user_id]["favorites"].remove(game_id)
-                self._save_user_data(user_data)
-                game_name = "Unknown Game"
-                try:  # Fetch name for confirmation message
-                    game_data = self.bgg.fetch_thing_data(game_id, stats=False)
-                    game_name = game_data.get("name", game_name)
-                except Exception:
-                    pass  # Ignore if fetching name fails, just use ID
-                await ctx.send(
-                    f"Removed '{game_name}' (ID: {game_id}) from your favorites.",
-                    ephemeral=True,
-                )
-            else:
-                await ctx.send(
-                    f"Game ID '{game_id}' was not found in your favorites.",
-                    ephemeral=True,
+            lines = []
+            removed_any = False
+            for entry in entries:
+                if entry.isdigit():
+                    removed = next((f for f in favorites if f["id"] == entry), None)
+                else:
+                    # Names are matched against the stored names, without searching
+                    key = normalize_query(entry)
+                    removed = next(
+                        (
+                            f
+                            for f in favorites
+                            if f["name"] and normalize_query(f["name"]) == key
+                        ),
+                        None,
+                    )
+
+                if removed is None:
+                    lines.append(
+                        f"Game ID '{entry}' was not found in your favorites."
+                        if entry.isdigit()
+                        else f"'{entry}' was not found in your favorites."
+                    )
+                    continue
+                favorites.remove(removed)
+                removed_any = True
+                game_name = removed["name"] or "Unknown Game"
+                lines.append(
+                    f"Removed '{game_name}' (ID: {removed['id']}) from your favorites."
                 )
 
+            if removed_any:
+                self._save_user_data(user_data)
+            await self._send_summary(ctx, lines)
+
         except Exception as e:
             print(f"Error in bggfav_remove: {e}")
             await ctx.send(
@@ -401,70 +1169,42 @@ class BggCommands(commands.Cog):
     @bggfav.command(name="list", description="List your favorite games")
     async def bggfav_list(self, ctx: commands.Context):
         """Displays your saved favorite games."""
-        await ctx.defer()  # Can take time to fetch details, so don't make ephemeral initially
+        await ctx.defer()
         user_id = str(ctx.author.id)
 
         try:
             user_data = self._load_user_data()
+            favorites = self._get_favorites(user_data, user_id)
 
-            if (
-                user_id not in user_data
-                or "favorites" not in user_data[user_id]
-                or not user_data[user_id]["favorites"]
-            ):
+            if not favorites:
                 await ctx.send(
                     "You haven't added any favorite games yet. Use `!bggfav add <game>`.",
                     ephemeral=True,
                 )
                 return
 
-            favorite_ids = user_data[user_id]["favorites"]
-            if not favorite_ids:
-                await ctx.send(
-                    "You haven't added any favorite games yet. Use `!bggfav add <game>`.",
-                    ephemeral=True,
+            with span("render"):
+                embed = discord.Embed(
+                    title=f"{ctx.author.display_name}'s Favorite Games",
+                    color=discord.Color.purple(),
                 )
-                return
 
-            embed = discord.Embed(
-                title=f"{ctx.author.display_name}'s Favorite Games",
-                color=discord.Color.purple(),
-            )
-
-            description_lines = []
-            fetch_errors = 0
-            for i, game_id in enumerate(favorite_ids):
-                try:
-                    game_data = self.bgg.fetch_thing_data(game_id, stats=False)
-                    game_name = game_data.get("name", f"ID: {game_id}")
-                    game_year = game_data.get("year", "N/A")
+                # Everything is rendered from the stored entries, without BGG calls
+                description_lines = []
+                for i, favorite in enumerate(favorites):
+                    game_id = favorite["id"]
+                    game_name = favorite["name"] or f"ID: {game_id}"
+                    game_year = favorite["year"] or "N/A"
                     description_lines.append(
                         f"{i+1}. [{game_name} ({game_year})](https://boardgamegeek.com/boardgame/{game_id}) - ID: `{game_id}`"
                     )
-                except Exception as fetch_e:
-                    print(
-                        f"Error fetching details for favorite game ID {game_id}: {fetch_e}"
-                    )
-                    description_lines.append(
-                        f"{i+1}. *Error fetching details for ID:* `{game_id}`"
-                    )
-                    fetch_errors += 1
-
-            if (
-                not description_lines
-            ):  # Should not happen if favorite_ids is not empty, but safety check
-                await ctx.send(
-                    "Could not retrieve details for your favorites.", ephemeral=True
-                )
-                return
 
-            embed.description = "\n".join(description_lines)
-            if fetch_errors > 0:
-                embed.set_footer(
-                    text=f"Note: Could not fetch details for {fetch_errors} game(s)."
-                )
+                embed.description = "\n".join(description_lines)
+                if favorites[0]["thumbnail"]:
+                    embed.set_thumbnail(url=favorites[0]["thumbnail"])
 
-            await ctx.send(embed=embed)
+            with span("discord.send"):
+                await ctx.send(embed=embed)
 
         except Exception as e:
             print(f"Error in bggfav_list: {e}")
@@ -0,0 +1,36 @@
+from typing import Dict, List
+
+# A game must move at least this many places to count as a notable move
+DEFAULT_MOVE_THRESHOLD = 5
+
+
+def diff_hot_lists(
+    previous: List[Dict],
+    current: List[Dict],
+    move_threshold: int = DEFAULT_MOVE_THRESHOLD,
+) -> Dict[str, List]:
+    """Compares two Hotness snapshots.
+
+    Returns the items that entered and left the list, and (item, old_rank,
+    new_rank) tuples for items that moved at least `move_threshold` places.
+    """
+    previous_ranks = {item["id"]: int(item["rank"]) for item in previous}
+    current_ids = {item["id"] for item in current}
+
+    entered = [item for item in current if item["id"] not in previous_ranks]
+    left = [item for item in previous if item["id"] not in current_ids]
+    moved = []
+    for item in current:
+        old_rank = previous_ranks.get(item["id"])
+        if old_rank is None:
+            continue
+        new_rank = int(item["rank"])
+        if abs(new_rank - old_rank) >= move_threshold:
+            moved.append((item, old_rank, new_rank))
+    # Biggest movers first
+    moved.sort(key=lambda move: -abs(move[2] - move[1]))
+    return {"entered": entered, "left": left, "moved": moved}
+
+
+def has_changes(diff: Dict[str, List]) -> bool:
+    return any(diff[key] for key in ("entered", "left", "moved"))
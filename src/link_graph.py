@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .bgg_api import BGGClient
+from .tracing import span
+
+EXPANSION_LINK = "boardgameexpansion"
+FAMILY_LINK = "boardgamefamily"
+
+# Nodes are keyed by kind and BGG id, since families and games share id ranges
+THING = "thing"
+FAMILY = "family"
+
+
+class LinkGraph:
+    """Walks the links between BGG games and families breadth-first.
+
+    Every level of a walk is fetched with batched requests, one per kind of
+    node, and fetched nodes are cached for `ttl` seconds so overlapping walks
+    reuse them. The least recently used nodes are evicted once `max_entries`
+    is reached.
+    """
+
+    def __init__(
+        self, bgg: BGGClient, ttl: float = 6 * 60 * 60, max_entries: int = 4096
+    ):
+        self.bgg = bgg
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def walk(
+        self,
+        root_id: str,
+        link_types: Iterable[str],
+        max_depth: int = 1,
+        max_nodes: int = 100,
+        max_per_node: Optional[int] = None,
+    ) -> Optional[Dict]:
+        """Collects the nodes reachable from a game through `link_types` links.
+
+        From a game, only its own outbound links of the given types are
+        followed, so expansions lead away from their base game, and each node
+        is visited once. Families already name their games, so each family's
+        members are built from its own links without fetching them (a game in
+        two families is listed under both), and the walk ends there. At most
+        `max_per_node` links are taken from each node and `max_nodes` nodes in
+        total, after which the walk is marked truncated. Returns {"root",
+        "levels", "truncated"}, where levels[0] holds the nodes one link away
+        as {"node", "parent"} dicts, or None if the root game doesn't exist.
+        """
+        link_types = set(link_types)
+        root_key = (THING, root_id)
+        root = self._fetch([root_key]).get(root_key)
+        if root is None:
+            return None
+
+        seen = {root_key}
+        count = 0
+        levels = []
+        truncated = False
+        frontier = [root]
+        for depth in range(1, max_depth + 1):
+            # (key, parent) pairs; a family member can appear under several parents
+            pairs = []
+            members = {}
+            for node in frontier:
+                if node["type"] == FAMILY_LINK:
+                    links = {}
+                    for link in node["links"]:
+                        if (THING, link["id"]) != root_key:
+                            links.setdefault((THING, link["id"]), link)
+                    members.update(links)
+                    neighbours = list(links)
+                else:
+                    neighbours = [
+                        key
+                        for key in dict.fromkeys(self._neighbours(node, link_types))
+                        if key not in seen
+                    ]
+                if max_per_node is not None and len(neighbours) > max_per_node:
+                    neighbours = neighbours[:max_per_node]
+                    truncated = True
+                for key in neighbours:
+                    is_member = node["type"] == FAMILY_LINK
+                    if not is_member and key in seen:
+                        continue  # Linked from two games on this level
+                    if count >= max_nodes:
+                        truncated = True
+                        break
+                    if not is_member:
+                        seen.add(key)
+                    count += 1
+                    pairs.append((key, node))
+            if not pairs:
+                break
+
+            with span("graph.level", depth=depth, nodes=len(pairs)):
+                nodes = self._fetch(
+                    list(dict.fromkeys(key for key, _ in pairs if key not in members))
+                )
+            for key, link in members.items():
+                nodes[key] = {
+                    "id": key[1],
+                    "type": "boardgame",
+                    "name": link["value"],
+                    "year": None,
+                    "links": [],
+                }
+            # Keep link order; ids BGG no longer knows are dropped
+            level = [
+                {"node": nodes[key], "parent": parent}
+                for key, parent in pairs
+                if key in nodes
+            ]
+            levels.append(level)
+            frontier = [entry["node"] for entry in level]
+
+        return {"root": root, "levels": levels, "truncated": truncated}
+
+    def _neighbours(self, node: Dict, link_types: set) -> List[Tuple[str, str]]:
+        if node["type"] == FAMILY_LINK:
+            return [(THING, link["id"]) for link in node["links"]]
+        return [
+            (FAMILY if link["type"] == FAMILY_LINK else THING, link["id"])
+            for link in node["links"]
+            if link["type"] in link_types and not link["inbound"]
+        ]
+
+    def _fetch(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+        """Returns the nodes for `keys`, fetching the uncached ones in batches."""
+        found = {}
+        if not keys:
+            return found
+        missing = {THING: [], FAMILY: []}
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is not None and now - entry["cached_at"] < self.ttl:
+                    self._cache.move_to_end(key)
+                    found[key] = entry["node"]
+                else:
+                    missing[key[0]].append(key[1])
+
+        fetched = []
+        if missing[THING]:
+            fetched += [(THING, n) for n in self.bgg.fetch_things(missing[THING])]
+        if missing[FAMILY]:
+            fetched += [(FAMILY, n) for n in self.bgg.fetch_families(missing[FAMILY])]
+
+        with self._lock:
+            for kind, node in fetched:
+                key = (kind, node["id"])
+                found[key] = node
+                self._cache[key] = {"node": node, "cached_at": now}
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return found
+
+    def stats(self) -> Dict:
+        """Summarises the cache for operators."""
+        with self._lock:
+            return {"entries": len(self._cache)}
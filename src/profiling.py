@@ -0,0 +1,99 @@
+import asyncio
+import cProfile
+import io
+import marshal
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+# Longest capture allowed from the owner command; the HTTP route caps lower
+MAX_PROFILE_SECONDS = 60
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Only one on-demand capture may run at a time
+capture_lock = threading.Lock()
+
+
+def _collapse(frame) -> str:
+    """Formats a frame's stack root-first, in Brendan Gregg's collapsed format."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread.
+
+    Nothing runs until start() is called, so an idle sampler costs nothing.
+    """
+
+    def __init__(self, thread_id: int, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[_collapse(frame)] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> str:
+        """Stops sampling and returns the collapsed stacks, one per line."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.items())
+
+
+def sample_thread(thread_id: int, seconds: float) -> str:
+    """Samples a thread for `seconds` and returns collapsed stacks for a flamegraph."""
+    sampler = StackSampler(thread_id)
+    sampler.start()
+    time.sleep(seconds)
+    return sampler.stop()
+
+
+def format_pstats(profiler: cProfile.Profile, limit: int = 60) -> str:
+    """Renders the profiler's top functions by cumulative time as text."""
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    return stream.getvalue()
+
+
+def dump_pstats(profiler: cProfile.Profile) -> bytes:
+    """Serialises the profile in the binary format pstats/snakeviz load."""
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
+
+
+def profile_loop(loop: asyncio.AbstractEventLoop, seconds: float) -> cProfile.Profile:
+    """Runs cProfile inside the event loop's thread for `seconds`, from another thread.
+
+    cProfile only sees the thread that enabled it, so enable and disable are
+    scheduled onto the loop itself.
+    """
+    profiler = cProfile.Profile()
+    stopped = threading.Event()
+
+    def stop():
+        profiler.disable()
+        stopped.set()
+
+    loop.call_soon_threadsafe(profiler.enable)
+    time.sleep(seconds)
+    loop.call_soon_threadsafe(stop)
+    stopped.wait(timeout=5)
+    return profiler
@@ -0,0 +1,259 @@
+import csv
+import hashlib
+import json
+import mmap
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .resolver import normalize_query
+
+# Fixed-width columns kept from the BGG ranks dump, in on-disk dtype
+COLUMNS = {
+    "id": np.int32,
+    "year": np.int16,
+    "rank": np.int32,
+    "average": np.float32,
+    "bayes_average": np.float32,
+    "users_rated": np.int32,
+    "weight": np.float32,
+    "is_expansion": np.bool_,
+}
+# CSV header for each column; weight is not in the official dump but is
+# picked up when a dump with an averageweight column is supplied
+CSV_FIELDS = {
+    "id": "id",
+    "year": "yearpublished",
+    "rank": "rank",
+    "average": "average",
+    "bayes_average": "bayesaverage",
+    "users_rated": "usersrated",
+    "weight": "averageweight",
+    "is_expansion": "is_expansion",
+}
+MISSING = {np.float32: np.nan, np.bool_: False}
+
+
+def _key_hash(key: str) -> int:
+    """Stable 64-bit hash of a normalized name, for the sorted lookup column."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _parse_value(raw: Optional[str], dtype):
+    """Converts a CSV cell to the column's dtype, using 0 / NaN when blank."""
+    if raw is None or raw.strip() == "":
+        return MISSING.get(dtype, 0)
+    if dtype is np.float32:
+        return float(raw)
+    return int(float(raw))
+
+
+def build_ranks_store(csv_path: Union[str, Path], store_dir: Union[str, Path]) -> int:
+    """Converts a BGG ranks CSV dump into a columnar store. Returns the row count."""
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    rows = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for record in csv.DictReader(f):
+            rows.append(record)
+    # Rows are kept sorted by id so lookups are a binary search
+    rows.sort(key=lambda record: int(record["id"]))
+
+    for column, dtype in COLUMNS.items():
+        field = CSV_FIELDS[column]
+        values = np.array(
+            [_parse_value(record.get(field), dtype) for record in rows], dtype=dtype
+        )
+        np.save(store_dir / f"{column}.npy", values)
+
+    # Names go into a single UTF-8 string table addressed by offsets
+    encoded = [record["name"].encode("utf-8") for record in rows]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(name) for name in encoded])
+    np.save(store_dir / "name_offsets.npy", offsets)
+    with open(store_dir / "names.bin", "wb") as f:
+        f.write(b"".join(encoded))
+
+    # Normalized names for lookups without BGG search: a hash column sorted for
+    # searchsorted, and a newline-separated table for substring matches
+    keys = [normalize_query(record["name"]) for record in rows]
+    hashes = np.array([_key_hash(key) for key in keys], dtype=np.uint64)
+    order = np.argsort(hashes, kind="stable")
+    np.save(store_dir / "name_key_hashes.npy", hashes[order])
+    np.save(store_dir / "name_key_rows.npy", order.astype(np.int32))
+    encoded_keys = [key.encode("utf-8") for key in keys]
+    key_offsets = np.zeros(len(encoded_keys) + 1, dtype=np.int64)
+    key_offsets[1:] = np.cumsum([len(key) + 1 for key in encoded_keys])
+    np.save(store_dir / "name_key_offsets.npy", key_offsets)
+    with open(store_dir / "name_keys.bin", "wb") as f:
+        f.write(b"".join(key + b"\n" for key in encoded_keys))
+
+    with open(store_dir / "meta.json", "w") as f:
+        json.dump({"rows": len(rows), "source": str(csv_path)}, f, indent=4)
+    return len(rows)
+
+
+class RanksStore:
+    """Read-only, memory-mapped view over a store written by build_ranks_store."""
+
+    def __init__(self, store_dir: Union[str, Path]):
+        store_dir = Path(store_dir)
+        self.columns = {
+            column: np.load(store_dir / f"{column}.npy", mmap_mode="r")
+            for column in COLUMNS
+        }
+        # The official dump has no weight column, leaving it all NaN
+        self.has_weights = not np.isnan(self.columns["weight"]).all()
+        self._name_offsets = np.load(store_dir / "name_offsets.npy", mmap_mode="r")
+        names_path = store_dir / "names.bin"
+        self._names = (
+            np.memmap(names_path, dtype=np.uint8, mode="r")
+            if names_path.stat().st_size
+            else np.zeros(0, dtype=np.uint8)
+        )
+        self._key_hashes = np.load(store_dir / "name_key_hashes.npy", mmap_mode="r")
+        self._key_rows = np.load(store_dir / "name_key_rows.npy", mmap_mode="r")
+        self._key_offsets = np.load(store_dir / "name_key_offsets.npy", mmap_mode="r")
+        keys_path = store_dir / "name_keys.bin"
+        self._keys = b""
+        if keys_path.stat().st_size:
+            with open(keys_path, "rb") as f:
+                self._keys = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def open(cls, store_dir: Union[str, Path]) -> Optional["RanksStore"]:
+        """Opens the store if it exists, returning None when it has not been built."""
+        if not (Path(store_dir) / "meta.json").exists():
+            return None
+        if not (Path(store_dir) / "name_key_hashes.npy").exists():
+            print(f"Ranks store in {store_dir} predates name lookups; rebuild it.")
+            return None
+        return cls(store_dir)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def _name(self, index: int) -> str:
+        start, end = self._name_offsets[index], self._name_offsets[index + 1]
+        return self._names[start:end].tobytes().decode("utf-8")
+
+    def _record(self, index: int) -> Dict:
+        """Materialises one row as a plain dict."""
+        weight = float(self.columns["weight"][index])
+        year = int(self.columns["year"][index])
+        rank = int(self.columns["rank"][index])
+        return {
+            "id": str(self.columns["id"][index]),
+            "name": self._name(index),
+            "year": str(year) if year else None,
+            "rank": rank or None,
+            "average": float(self.columns["average"][index]),
+            "bayes_average": float(self.columns["bayes_average"][index]),
+            "users_rated": int(self.columns["users_rated"][index]),
+            "weight": None if np.isnan(weight) else weight,
+            "is_expansion": bool(self.columns["is_expansion"][index]),
+        }
+
+    def get(self, game_id: Union[str, int]) -> Optional[Dict]:
+        """Looks up a single game by BGG ID."""
+        ids = self.columns["id"]
+        game_id = int(game_id)
+        index = int(np.searchsorted(ids, game_id))
+        if index < len(ids) and ids[index] == game_id:
+            return self._record(index)
+        return None
+
+    def _filter_mask(
+        self,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        min_weight: Optional[float] = None,
+        max_weight: Optional[float] = None,
+        min_users_rated: int = 0,
+        include_expansions: bool = False,
+    ) -> np.ndarray:
+        cols = self.columns
+        mask = cols["users_rated"] >= min_users_rated
+        if not include_expansions:
+            mask &= ~cols["is_expansion"]
+        if year_from is not None:
+            mask &= cols["year"] >= year_from
+        if year_to is not None:
+            mask &= cols["year"] <= year_to
+        # NaN weights compare False, so unweighted rows drop out of weight filters
+        if min_weight is not None:
+            mask &= cols["weight"] >= min_weight
+        if max_weight is not None:
+            mask &= cols["weight"] <= max_weight
+        return mask
+
+    def find(self, query: str) -> Optional[Dict]:
+        """Looks up a game by name, for when BGG search is unavailable.
+
+        Exact matches (after normalize_query) win, then names containing the
+        query; ties go to the game with the most ratings.
+        """
+        key = normalize_query(query)
+        if not key:
+            return None
+        users_rated = self.columns["users_rated"]
+
+        target = np.uint64(_key_hash(key))
+        start = int(np.searchsorted(self._key_hashes, target, side="left"))
+        end = int(np.searchsorted(self._key_hashes, target, side="right"))
+        # Hash collisions are possible, so confirm against the stored name
+        matches = [
+            int(row)
+            for row in self._key_rows[start:end]
+            if normalize_query(self._name(int(row))) == key
+        ]
+
+        if not matches:
+            # Scan the key table in C; each hit jumps to the start of the next key
+            needle = key.encode("utf-8")
+            pos = self._keys.find(needle)
+            while pos != -1:
+                row = int(np.searchsorted(self._key_offsets, pos, side="right")) - 1
+                matches.append(row)
+                pos = self._keys.find(needle, int(self._key_offsets[row + 1]))
+        if not matches:
+            return None
+        return self._record(max(matches, key=lambda row: users_rated[row]))
+
+    def _top(self, keys: np.ndarray, mask: np.ndarray, n: int) -> List[Dict]:
+        """Returns the records with the n smallest keys among rows in mask."""
+        candidates = np.flatnonzero(mask)
+        if n <= 0 or not len(candidates):
+            return []
+        keys = keys[candidates]
+        if n < len(candidates):
+            part = np.argpartition(keys, n - 1)[:n]
+        else:
+            part = np.arange(len(candidates))
+        ordered = candidates[part[np.argsort(keys[part], kind="stable")]]
+        return [self._record(int(i)) for i in ordered]
+
+    def top_by_rank(self, n: int = 10, **filters) -> List[Dict]:
+        """Top n ranked games, optionally filtered by year, weight and users rated."""
+        mask = self._filter_mask(**filters) & (self.columns["rank"] > 0)
+        return self._top(np.asarray(self.columns["rank"]), mask, n)
+
+    def top_by_rating(self, n: int = 10, **filters) -> List[Dict]:
+        """Top n games by average rating, optionally filtered like top_by_rank."""
+        mask = self._filter_mask(**filters)
+        return self._top(-np.asarray(self.columns["average"]), mask, n)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Build the offline ranks store from a BGG ranks CSV dump."
+    )
+    parser.add_argument("csv_path", help="Path to the boardgames_ranks.csv dump")
+    parser.add_argument("store_dir", help="Directory to write the store into")
+    args = parser.parse_args()
+    count = build_ranks_store(args.csv_path, args.store_dir)
+    print(f"Wrote {count} games to {args.store_dir}")
@@ -0,0 +1,88 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .bgg_api import BGGClient
+from .tracing import span
+
+LEADING_ARTICLES = ("the", "a", "an")
+
+
+def normalize_query(query: str) -> str:
+    """Folds case, punctuation, whitespace and a leading article out of a query."""
+    words = re.sub(r"[^\w\s]", " ", query.casefold()).split()
+    if len(words) > 1 and words[0] in LEADING_ARTICLES:
+        words = words[1:]
+    # Queries made only of punctuation still need a usable key
+    return " ".join(words) or query.strip().casefold()
+
+
+class QueryResolver:
+    """Resolves a game ID or name to a BGG ID, remembering name searches.
+
+    Entries live for `ttl` seconds and the least recently used ones are evicted
+    once `max_entries` is reached.
+    """
+
+    def __init__(self, bgg: BGGClient, ttl: float = 24 * 60 * 60, max_entries=2048):
+        self.bgg = bgg
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        # Bulk commands resolve from worker threads
+        self._lock = threading.Lock()
+
+    def resolve(self, query: str) -> Optional[Dict]:
+        """Returns {"id", "name", "year"} for the best match, or None if nothing matched.
+
+        Numeric queries are taken as IDs without a search, so "name" and
+        "year" are None.
+        """
+        with span("resolve") as resolve_span:
+            return self._resolve(query.strip(), resolve_span)
+
+    def _resolve(self, query: str, resolve_span) -> Optional[Dict]:
+        if query.isdigit():
+            resolve_span.set("cache", "id")
+            return {"id": query, "name": None, "year": None}
+
+        key = normalize_query(query)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry["cached_at"] < self.ttl:
+                resolve_span.set("cache", "hit")
+                entry["hits"] += 1
+                self._cache.move_to_end(key)
+                return {"id": entry["id"], "name": entry["name"], "year": entry["year"]}
+
+        resolve_span.set("cache", "miss")
+        results = self.bgg.search_bgg(query)
+        if not results:
+            return None
+
+        with self._lock:
+            self._cache[key] = {
+                "id": results[0]["id"],  # Use the ID of the first search result
+                "name": results[0].get("name"),
+                "year": results[0].get("year"),
+                "hits": 0,
+                "cached_at": time.monotonic(),
+            }
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return {
+            "id": results[0]["id"],
+            "name": results[0].get("name"),
+            "year": results[0].get("year"),
+        }
+
+    def stats(self) -> Dict:
+        """Summarises the cache for operators."""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "hits": sum(entry["hits"] for entry in self._cache.values()),
+            }
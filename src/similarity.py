@@ -0,0 +1,155 @@
+import numpy as np
+from typing import Dict, List, Tuple
+
+# Link types that describe what a game *is*, and how much each one counts
+FEATURE_WEIGHTS = {
+    "boardgamemechanic": 1.0,
+    "boardgamecategory": 0.8,
+    "boardgamedesigner": 1.2,
+}
+# Scale applied to the normalised weight (1-5) and rating (1-10) features
+WEIGHT_FEATURE_SCALE = 1.5
+RATING_FEATURE_SCALE = 0.5
+# Compact the arrays once this fraction of the stored entries is stale
+COMPACT_STALE_FRACTION = 0.5
+
+
+class SimilarityIndex:
+    """Sparse feature matrix over every game the bot has parsed.
+
+    Each game is a row of (feature, value) pairs stored in flat COO arrays, so
+    a query is a handful of vectorised NumPy passes over all non-zeros instead
+    of a Python loop over candidate games.
+    """
+
+    def __init__(self, initial_capacity: int = 4096):
+        self._feature_ids: Dict[str, int] = {}
+        self._row_ids: Dict[str, int] = {}
+        self._games: List[Dict] = []
+        self._features: List[Dict[int, float]] = []
+        self._rows = np.empty(initial_capacity, dtype=np.int32)
+        self._cols = np.empty(initial_capacity, dtype=np.int32)
+        self._vals = np.empty(initial_capacity, dtype=np.float32)
+        self._nnz = 0
+        self._stale = 0
+        self._norms = np.zeros(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._row_ids)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._row_ids
+
+    def _feature_index(self, key: str) -> int:
+        if key not in self._feature_ids:
+            self._feature_ids[key] = len(self._feature_ids)
+        return self._feature_ids[key]
+
+    def _game_features(self, game: Dict) -> Dict[int, float]:
+        """Turns parsed thing data into a {feature column: value} mapping."""
+        features = {}
+        for link in game.get("links", []):
+            weight = FEATURE_WEIGHTS.get(link.get("type"))
+            if weight is not None and link.get("id"):
+                key = f"{link['type']}:{link['id']}"
+                features[self._feature_index(key)] = weight
+
+        stats = game.get("stats") or {}
+        for stat, scale, top in (
+            ("weight", WEIGHT_FEATURE_SCALE, 5.0),
+            ("average", RATING_FEATURE_SCALE, 10.0),
+        ):
+            try:
+                value = float(stats.get(stat) or 0)
+            except ValueError:
+                value = 0.0
+            if value > 0:
+                features[self._feature_index(f"stat:{stat}")] = scale * value / top
+        return features
+
+    def _grow(self, needed: int):
+        capacity = len(self._rows)
+        if self._nnz + needed <= capacity:
+            return
+        while self._nnz + needed > capacity:
+            capacity *= 2
+        self._rows = np.resize(self._rows, capacity)
+        self._cols = np.resize(self._cols, capacity)
+        self._vals = np.resize(self._vals, capacity)
+
+    def add_game(self, game: Dict):
+        """Adds or replaces a game's row. Games without any link data are skipped."""
+        game_id = game.get("id")
+        if not game_id or not game.get("links"):
+            return
+        features = self._game_features(game)
+        if not features:
+            return
+
+        info = {"id": game_id, "name": game.get("name"), "year": game.get("year")}
+        if game_id in self._row_ids:
+            row = self._row_ids[game_id]
+            self._games[row] = info
+            if features == self._features[row]:
+                return  # Commands re-add the same games constantly
+            # Zero out the stale entries; they are dropped on the next compaction
+            stale = self._rows[: self._nnz] == row
+            self._vals[: self._nnz][stale] = 0.0
+            self._stale += len(self._features[row])
+        else:
+            row = len(self._games)
+            self._row_ids[game_id] = row
+            self._games.append(info)
+            self._features.append({})
+            self._norms = np.resize(self._norms, row + 1)
+        self._features[row] = features
+
+        cols = np.fromiter(features.keys(), dtype=np.int32, count=len(features))
+        vals = np.fromiter(features.values(), dtype=np.float32, count=len(features))
+        self._grow(len(features))
+        end = self._nnz + len(features)
+        self._rows[self._nnz : end] = row
+        self._cols[self._nnz : end] = cols
+        self._vals[self._nnz : end] = vals
+        self._nnz = end
+        self._norms[row] = np.sqrt(np.dot(vals, vals))
+
+        if self._stale > COMPACT_STALE_FRACTION * self._nnz:
+            self._compact()
+
+    def _compact(self):
+        """Drops the zeroed entries left behind by replaced rows."""
+        live = np.flatnonzero(self._vals[: self._nnz])
+        count = len(live)
+        self._rows[:count] = self._rows[live]
+        self._cols[:count] = self._cols[live]
+        self._vals[:count] = self._vals[live]
+        self._nnz = count
+        self._stale = 0
+
+    def most_similar(self, game_id: str, k: int = 10) -> List[Tuple[Dict, float]]:
+        """Returns the k games most similar to game_id by cosine similarity."""
+        row = self._row_ids.get(game_id)
+        if row is None:
+            return []
+
+        rows = self._rows[: self._nnz]
+        cols = self._cols[: self._nnz]
+        vals = self._vals[: self._nnz]
+
+        # Dense query vector over the feature space, then one gather per non-zero
+        query = np.zeros(len(self._feature_ids), dtype=np.float32)
+        own = rows == row
+        query[cols[own]] = vals[own]
+
+        dots = np.bincount(rows, weights=vals * query[cols], minlength=len(self._games))
+        denom = self._norms * self._norms[row]
+        scores = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+        scores[row] = -1.0
+
+        k = min(k, len(self._games) - 1)
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._games[i], float(scores[i])) for i in top if scores[i] > 0]
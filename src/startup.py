@@ -0,0 +1,58 @@
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class StartupTimer:
+    """Records how long each startup phase takes, for a one-line boot report."""
+
+    def __init__(self, started_at: Optional[float] = None):
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Times the wrapped block as a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def mark(self, name: str, since: float):
+        """Records a phase that started at `since` and ends now."""
+        self.phases.append((name, time.perf_counter() - since))
+
+    def report(self) -> str:
+        total = time.perf_counter() - self.started_at
+        parts = [f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.phases]
+        return f"Startup took {total:.2f}s: " + ", ".join(parts)
+
+
+def command_tree_hash(tree) -> str:
+    """Hashes the payload Discord would receive from tree.sync()."""
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands()),
+        key=lambda command: command["name"],
+    )
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def needs_sync(tree, hash_file: Path) -> Tuple[bool, str]:
+    """Returns whether the command tree changed since the hash in hash_file."""
+    current = command_tree_hash(tree)
+    try:
+        previous = hash_file.read_text().strip()
+    except OSError:
+        previous = None
+    return previous != current, current
+
+
+def save_sync_hash(hash_file: Path, tree_hash: str):
+    """Persists the hash of the last successfully synced command tree."""
+    hash_file.parent.mkdir(parents=True, exist_ok=True)
+    hash_file.write_text(tree_hash)
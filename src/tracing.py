@@ -0,0 +1,223 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+
+class Span:
+    """One timed stage of a trace."""
+
+    __slots__ = (
+        "name",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, name: str, parent_id: Optional[str], attributes: Dict):
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    def set(self, key: str, value):
+        self.attributes[key] = value
+
+    def finish(self, error: Optional[BaseException] = None):
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+
+class Trace:
+    """A command invocation: a root span plus every span started beneath it."""
+
+    def __init__(self, name: str, attributes: Dict):
+        self.trace_id = uuid.uuid4().hex
+        self.root = Span(name, None, attributes)
+        self.spans: List[Span] = []
+
+    def to_dict(self) -> Dict:
+        start = self.root.start_ns
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "timestamp": start / 1e9,
+            "duration_ms": round(self.root.duration_ms, 3),
+            "attributes": self.root.attributes,
+            "error": self.root.error,
+            "spans": [
+                {
+                    "name": span.name,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "offset_ms": round((span.start_ns - start) / 1e6, 3),
+                    "duration_ms": round(span.duration_ms, 3),
+                    "attributes": span.attributes,
+                    "error": span.error,
+                }
+                for span in self.spans
+            ],
+        }
+
+
+class NullSpan:
+    """Stands in for a span when nothing is being traced."""
+
+    def set(self, key: str, value):
+        pass
+
+
+NULL_SPAN = NullSpan()
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Times a stage of the current trace; a no-op outside a sampled trace."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield NULL_SPAN
+        return
+    parent = _current_span.get() or trace.root
+    current = Span(name, parent.span_id, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.finish(e)
+        raise
+    else:
+        current.finish()
+    finally:
+        _current_span.reset(token)
+        trace.spans.append(current)
+
+
+class JsonLinesExporter:
+    """Writes each finished trace as one JSON line to a file or stdout."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace):
+        line = json.dumps(trace.to_dict(), default=str)
+        with self._lock:
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(line + "\n")
+            else:
+                print(line, file=sys.stdout, flush=True)
+
+
+class OpenTelemetryExporter:
+    """Replays finished traces into the OpenTelemetry SDK, if it is installed."""
+
+    def __init__(self):
+        from opentelemetry import trace as otel_trace
+
+        self._otel_trace = otel_trace
+        self._tracer = otel_trace.get_tracer("bgg-discord-bot")
+
+    def export(self, trace: Trace):
+        otel_spans = {}
+
+        def start(span: Span, parent_id: Optional[str]):
+            parent = otel_spans.get(parent_id)
+            context = self._otel_trace.set_span_in_context(parent) if parent else None
+            attributes = {k: v for k, v in span.attributes.items() if v is not None}
+            attributes["bgg.trace_id"] = trace.trace_id
+            otel_spans[span.span_id] = self._tracer.start_span(
+                span.name,
+                context=context,
+                start_time=span.start_ns,
+                attributes=attributes,
+            )
+
+        start(trace.root, None)
+        # Spans are recorded as they finish, so parents come after children
+        for span in sorted(trace.spans, key=lambda s: s.start_ns):
+            start(span, span.parent_id)
+        for span in [trace.root] + trace.spans:
+            otel_span = otel_spans[span.span_id]
+            if span.error:
+                otel_span.set_attribute("error", span.error)
+            otel_span.end(end_time=span.end_ns)
+
+
+class Tracer:
+    """Starts sampled traces and hands finished ones to the exporters."""
+
+    def __init__(self, sample_rate: float = 0.0, exporters: Optional[List] = None):
+        self.sample_rate = sample_rate
+        self.exporters = exporters or []
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """Configures tracing from BGG_TRACE_SAMPLE_RATE, BGG_TRACE_FILE and BGG_TRACE_OTEL."""
+        sample_rate = float(os.getenv("BGG_TRACE_SAMPLE_RATE", "0"))
+        exporters = [JsonLinesExporter(os.getenv("BGG_TRACE_FILE"))]
+        if os.getenv("BGG_TRACE_OTEL"):
+            try:
+                exporters.append(OpenTelemetryExporter())
+            except ImportError:
+                print("BGG_TRACE_OTEL is set but opentelemetry is not installed.")
+        return cls(sample_rate, exporters)
+
+    def start_trace(self, name: str, **attributes):
+        """Starts a trace in the current context if it is sampled; returns a token."""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        return _current_trace.set(Trace(name, attributes))
+
+    def end_trace(self, token, error: Optional[BaseException] = None):
+        """Finishes the trace started with `token` and exports it."""
+        if token is None:
+            return
+        trace = _current_trace.get()
+        try:
+            _current_trace.reset(token)
+        except ValueError:
+            # The trace was started in a different context; just clear it here
+            _current_trace.set(None)
+        if trace is None:
+            return
+        trace.root.finish(error)
+        for exporter in self.exporters:
+            try:
+                exporter.export(trace)
+            except Exception as e:
+                print(f"Failed to export trace {trace.trace_id}: {e}")
+
+    @contextmanager
+    def trace(self, name: str, **attributes):
+        """Context-manager form of start_trace/end_trace."""
+        token = self.start_trace(name, **attributes)
+        try:
+            yield
+        except BaseException as e:
+            self.end_trace(token, e)
+            raise
+        else:
+            self.end_trace(token)
+
+
+tracer = Tracer.from_env()
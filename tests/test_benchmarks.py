@@ -0,0 +1,187 @@
+"""Offline microbenchmarks for the parser and render hot paths.
+
+Timings are divided by a fixed pure-Python calibration workload measured in
+the same run, so the stored baselines carry over between machines running
+the same Python version. Timing is noisy on shared runners, so the gate only
+runs when asked for:
+
+    BGG_BENCH=1 pytest tests/test_benchmarks.py
+
+A benchmark then fails when its normalized cost exceeds the baseline by more
+than BGG_BENCH_THRESHOLD (default 1.0, i.e. twice as slow). After an intentional
+change, refresh the baselines with:
+
+    BGG_BENCH_UPDATE=1 pytest tests/test_benchmarks.py
+"""
+
+import json
+import os
+import platform
+import pytest
+import statistics
+import timeit
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from xml.etree import ElementTree
+
+from discord.ext import commands
+
+from src.bgg_api import BGGClient
+from src.cogs.bgg_commands import BggCommands
+from src.hot_feed import diff_hot_lists
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "xmlapi2"
+BASELINES_FILE = Path(__file__).parent / "benchmark_baselines.json"
+THRESHOLD = float(os.getenv("BGG_BENCH_THRESHOLD", "1.0"))
+UPDATE = os.getenv("BGG_BENCH_UPDATE") == "1"
+ENABLED = UPDATE or os.getenv("BGG_BENCH") == "1"
+# Baselines only hold for the interpreter they were recorded with
+PYTHON_VERSION = ".".join(platform.python_version_tuple()[:2])
+# Each repeat runs for roughly this long; the fastest repeat is kept
+TARGET_REPEAT_SECONDS = 0.03
+REPEATS = 7
+
+
+def load_fixture(name: str) -> bytes:
+    return (FIXTURES_DIR / name).read_bytes()
+
+
+def best_time(func) -> float:
+    """Seconds per call, taking the fastest of several timed repeats."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * TARGET_REPEAT_SECONDS / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat=REPEATS, number=number)) / number
+
+
+def normalized_cost(func) -> float:
+    """Time per call in calibration units, calibrated right before measuring."""
+    return best_time(func) / best_time(calibration_workload)
+
+
+def calibration_workload():
+    """Fixed mix of string, dict and list work similar to the parsers'."""
+    rows = []
+    for i in range(2000):
+        row = {"id": str(i), "name": f"Game {i}", "value": i * 1.5}
+        rows.append(f"{row['name']} ({row['id']}): {row['value']:.2f}".lower())
+    return len(" ".join(rows).split())
+
+
+def offline_client(fixture: str) -> BGGClient:
+    """Builds a BGGClient whose requests return a recorded response."""
+    client = BGGClient(requests_per_second=1e9)
+    client.session.get = MagicMock(
+        return_value=MagicMock(content=load_fixture(fixture))
+    )
+    return client
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    """Loads stored baselines, and writes them back afterwards in update mode."""
+    stored = json.loads(BASELINES_FILE.read_text()) if BASELINES_FILE.exists() else {}
+    yield stored
+    if UPDATE:
+        stored["python"] = PYTHON_VERSION
+        BASELINES_FILE.write_text(json.dumps(stored, indent=4, sort_keys=True) + "\n")
+
+
+@pytest.fixture(scope="module")
+def cog():
+    """A cog instance for the render benchmarks."""
+    return BggCommands(bot=AsyncMock(spec=commands.Bot))
+
+
+@pytest.fixture(scope="module")
+def things():
+    client = offline_client("thing_batch_stats.xml")
+    return client.fetch_things(["1"], stats=True)
+
+
+def bench_search_bgg(cog, things):
+    client = offline_client("search_large.xml")
+    return lambda: client.search_bgg("query")
+
+
+def bench_parse_thing_data(cog, things):
+    client = BGGClient()
+    items = ElementTree.fromstring(load_fixture("thing_batch_stats.xml")).findall(
+        "item"
+    )
+    return lambda: [client._parse_thing_data(item) for item in items]
+
+
+def bench_fetch_things(cog, things):
+    client = offline_client("thing_batch_stats.xml")
+    return lambda: client.fetch_things(["1"], stats=True)
+
+
+def bench_fetch_hot_items(cog, things):
+    client = offline_client("hot.xml")
+    return lambda: client.fetch_hot_items()
+
+
+def bench_clean_description(cog, things):
+    descriptions = [game["description"] for game in things]
+    return lambda: [cog._clean_description(d) for d in descriptions]
+
+
+def bench_build_info_embed(cog, things):
+    return lambda: [cog._build_info_embed(game) for game in things]
+
+
+def bench_render_hot_update(cog, things):
+    hot = offline_client("hot.xml").fetch_hot_items()
+    previous = [dict(item, rank=str(51 - int(item["rank"]))) for item in hot[10:]]
+    diff = diff_hot_lists(previous, hot)
+    details = {game["id"]: game for game in things}
+    return lambda: cog._render_hot_update(diff, details)
+
+
+BENCHMARKS = {
+    name[len("bench_") :]: func
+    for name, func in list(globals().items())
+    if name.startswith("bench_")
+}
+
+
+def test_fixtures_parse():
+    """Sanity-check that the recorded corpus still exercises the hot paths."""
+    assert len(offline_client("search_large.xml").search_bgg("query")) >= 300
+    assert len(offline_client("hot.xml").fetch_hot_items()) == 50
+    things = offline_client("thing_batch_stats.xml").fetch_things(["1"], stats=True)
+    assert len(things) == 20
+    assert all(len(game["stats"]["ranks"]) >= 5 for game in things)
+    assert all(len(game["description"]) > 2000 for game in things)
+
+
+@pytest.mark.skipif(not ENABLED, reason="Set BGG_BENCH=1 to run the timing gate")
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmark(name, baselines, cog, things):
+    """Fails when a hot path is slower than its baseline beyond the threshold."""
+    func = BENCHMARKS[name](cog, things)
+    func()  # Warm up caches and lazy imports
+    cost = normalized_cost(func)
+
+    if UPDATE:
+        # Keep the median of a few runs so one lucky or unlucky run can't set the bar
+        cost = statistics.median([cost] + [normalized_cost(func) for _ in range(2)])
+        baselines[name] = round(cost, 4)
+        return
+    if name not in baselines:
+        pytest.skip(f"No baseline for {name}; run with BGG_BENCH_UPDATE=1")
+    if baselines.get("python") != PYTHON_VERSION:
+        pytest.skip(
+            f"Baselines were recorded on Python {baselines.get('python')}, "
+            f"not {PYTHON_VERSION}; run with BGG_BENCH_UPDATE=1"
+        )
+
+    limit = baselines[name] * (1 + THRESHOLD)
+    if cost > limit:
+        # A single slow measurement is usually noise; confirm before failing
+        cost = min(cost, normalized_cost(func))
+    assert cost <= limit, (
+        f"{name} regressed: {cost:.3f} calibration units per call, "
+        f"baseline {baselines[name]:.3f} (limit {limit:.3f})"
+    )
@@ -1,4 +1,5 @@
 import pytest
+import threading
 import discord
 from discord.ext import commands
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -33,6 +34,7 @@ def mock_bgg_client():
     client = MagicMock(spec=BGGClient)
     client.search_bgg = MagicMock()
     client.fetch_thing_data = MagicMock()
+    client.is_degraded = MagicMock(return_value=False)
     client.fetch_hot_items = MagicMock()
     return client
 
@@ -117,3 +119,31 @@ async def test_bgg_search(bgg_cog, mock_context, mock_bgg_client):
 
 
 # Add more tests for bgg_hot, bgg_image etc. if desired
+
+
+@pytest.mark.asyncio
+async def test_bgg_hot_keeps_requests_off_event_loop(
+    bgg_cog, mock_context, mock_bgg_client
+):
+    """Test that rate-limited BGG calls run in worker threads, not on the loop."""
+    loop_thread = threading.get_ident()
+    request_threads = []
+
+    def record(result):
+        def call(*args, **kwargs):
+            request_threads.append(threading.get_ident())
+            return result
+
+        return call
+
+    mock_bgg_client.fetch_hot_items.side_effect = record(
+        [{"id": "1", "rank": "1", "name": "Game", "year": "2024"}]
+    )
+    mock_bgg_client.fetch_thing_data.side_effect = record(
+        {"id": "1", "name": "Game", "year": "2024", "links": [], "stats": {}}
+    )
+
+    await bgg_cog.bgg_hot.callback(bgg_cog, mock_context)
+
+    assert len(request_threads) == 2
+    assert loop_thread not in request_threads
@@ -0,0 +1,98 @@
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from src.bgg_api import BGGClient, BGGUnavailableError
+from src.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+SEARCH_XML = b"""<items total="1"><item type="boardgame" id="266192">
+<name type="primary" value="Wingspan"/><yearpublished value="2019"/></item></items>"""
+
+
+@pytest.fixture
+def clock():
+    """Fixture that freezes time.monotonic inside the breaker module."""
+    with patch("src.circuit_breaker.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+def trip(breaker):
+    for _ in range(breaker.min_calls):
+        breaker.allow_request()
+        breaker.record_failure(0.1)
+
+
+def test_opens_on_failure_rate(clock):
+    """Test that the circuit opens once failures dominate the window."""
+    breaker = CircuitBreaker(min_calls=4, failure_rate=0.5)
+    breaker.record_success(0.1)
+    breaker.record_success(0.1)
+    breaker.record_failure(0.1)
+    assert breaker.state == CLOSED
+
+    breaker.record_failure(0.1)
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+
+def test_opens_on_slow_calls(clock):
+    """Test that successful but slow calls also open the circuit."""
+    breaker = CircuitBreaker(min_calls=2, slow_call_seconds=5, slow_call_rate=0.5)
+    breaker.record_success(6.0)
+    breaker.record_success(7.0)
+
+    assert breaker.state == OPEN
+
+
+def test_half_open_limits_probes_and_recovers(clock):
+    """Test that after cooldown only limited probes go through until recovery."""
+    breaker = CircuitBreaker(
+        min_calls=2, cooldown=30, half_open_max_calls=1, half_open_successes=2
+    )
+    trip(breaker)
+
+    clock.return_value += 31
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # Second concurrent probe is refused
+
+    breaker.record_success(0.1)
+    assert breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_failure_reopens(clock):
+    """Test that a failed probe reopens the circuit."""
+    breaker = CircuitBreaker(min_calls=2, cooldown=30)
+    trip(breaker)
+    clock.return_value += 31
+
+    assert breaker.allow_request()
+    breaker.record_failure(0.1)
+
+    snapshot = breaker.snapshot()
+    assert snapshot["state"] == OPEN
+    assert snapshot["times_opened"] == 2
+
+
+def test_client_serves_cache_when_open():
+    """Test that an open circuit answers from the cache or fails fast."""
+    client = BGGClient()
+    response = MagicMock(content=SEARCH_XML)
+    client.session.get = MagicMock(return_value=response)
+
+    assert client.search_bgg("Wingspan")[0]["id"] == "266192"
+
+    client.session.get.side_effect = requests.exceptions.ConnectionError("down")
+    for _ in range(client.breaker.min_calls - 1):
+        with pytest.raises(Exception, match="BGG API request failed"):
+            client.search_bgg("Azul")
+    assert client.is_degraded()
+
+    calls_before = client.session.get.call_count
+    assert client.search_bgg("Wingspan")[0]["name"] == "Wingspan"
+    with pytest.raises(BGGUnavailableError):
+        client.search_bgg("Azul")
+    assert client.session.get.call_count == calls_before  # No upstream traffic
@@ -0,0 +1,151 @@
+import pytest
+import discord
+from discord.ext import commands
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.bgg_api import BGGClient
+from src.cogs.bgg_commands import BggCommands
+from src.hot_feed import diff_hot_lists, has_changes
+
+
+def hot(*ids):
+    """Builds a Hotness list with the given ids ranked in order."""
+    return [
+        {"id": game_id, "rank": str(rank), "name": f"Game {game_id}", "year": "2024"}
+        for rank, game_id in enumerate(ids, start=1)
+    ]
+
+
+def test_diff_hot_lists():
+    """Test that entries, exits and big moves are detected."""
+    previous = hot("a", "b", "c", "d", "e", "f")
+    current = hot("f", "a", "b", "c", "g", "d")
+
+    diff = diff_hot_lists(previous, current, move_threshold=3)
+
+    assert [item["id"] for item in diff["entered"]] == ["g"]
+    assert [item["id"] for item in diff["left"]] == ["e"]
+    assert [(item["id"], old, new) for item, old, new in diff["moved"]] == [("f", 6, 1)]
+
+
+def test_unchanged_list_has_no_changes():
+    """Test that an identical snapshot yields no update."""
+    assert not has_changes(diff_hot_lists(hot("a", "b"), hot("a", "b")))
+
+
+@pytest.fixture
+def mock_bgg_client():
+    """Fixture for a mocked BGGClient."""
+    client = MagicMock(spec=BGGClient)
+    client.is_degraded = MagicMock(return_value=False)
+    client.fetch_hot_items = MagicMock(return_value=hot("a", "new1", "new2"))
+    client.fetch_things = MagicMock(
+        return_value=[
+            {"id": "new1", "stats": {"average": "8.1", "weight": "2.5"}},
+            {"id": "new2", "stats": {}},
+        ]
+    )
+    return client
+
+
+@pytest.fixture
+@patch("src.cogs.bgg_commands.BGGClient")
+def bgg_cog(MockBGGClient, mock_bgg_client, tmp_path):
+    """Fixture for the BggCommands cog with a mocked client and temp data files."""
+    MockBGGClient.return_value = mock_bgg_client
+    cog = BggCommands(bot=AsyncMock(spec=commands.Bot))
+    cog.HOT_FEED_FILE = tmp_path / "hot_feed.json"
+    return cog
+
+
+@pytest.mark.asyncio
+@patch("src.cogs.bgg_commands.asyncio.sleep", new_callable=AsyncMock)
+async def test_poll_fans_out_one_update(mock_sleep, bgg_cog, mock_bgg_client):
+    """Test that one snapshot and one batched fetch serve every channel."""
+    channels = {cid: AsyncMock(spec=discord.TextChannel) for cid in (1, 2, 3)}
+    bgg_cog.bot.get_channel = MagicMock(side_effect=channels.get)
+    bgg_cog.bot.fetch_channel = AsyncMock(
+        side_effect=discord.NotFound(MagicMock(status=404), "Unknown Channel")
+    )
+    bgg_cog._save_hot_feed({"channels": [1, 2, 3, 4], "snapshot": hot("a", "b")})
+
+    await bgg_cog.poll_hot_feed.coro(bgg_cog)
+
+    mock_bgg_client.fetch_hot_items.assert_called_once()
+    mock_bgg_client.fetch_things.assert_called_once_with(["new1", "new2"], True)
+    embeds = [c.send.call_args.kwargs["embed"] for c in channels.values()]
+    assert all(embed is embeds[0] for embed in embeds)
+    fields = {field.name: field.value for field in embeds[0].fields}
+    assert "Rating: 8.10, Weight: 2.50" in fields["New on the list"]
+    assert "Game b" in fields["Dropped off"]
+
+    feed = bgg_cog._load_hot_feed()
+    assert feed["channels"] == [1, 2, 3]  # Channel 4 no longer exists
+    assert feed["snapshot"] == hot("a", "new1", "new2")
+
+
+@pytest.mark.asyncio
+async def test_uncached_channel_is_fetched_not_dropped(bgg_cog):
+    """Test that channels missing from the cache are only dropped when gone."""
+    channel = AsyncMock(spec=discord.TextChannel)
+    bgg_cog.bot.get_channel = MagicMock(return_value=None)
+    bgg_cog.bot.fetch_channel = AsyncMock(return_value=channel)
+    bgg_cog._save_hot_feed({"channels": [1], "snapshot": hot("a", "b")})
+
+    await bgg_cog.poll_hot_feed.coro(bgg_cog)
+    channel.send.assert_called_once()
+    assert bgg_cog._load_hot_feed()["channels"] == [1]
+
+    # Transient API errors keep the subscription too
+    bgg_cog._save_hot_feed({"channels": [1], "snapshot": hot("a", "b")})
+    bgg_cog.bot.fetch_channel.side_effect = discord.HTTPException(
+        MagicMock(status=503), "Service Unavailable"
+    )
+    await bgg_cog.poll_hot_feed.coro(bgg_cog)
+    assert bgg_cog._load_hot_feed()["channels"] == [1]
+
+
+@pytest.mark.asyncio
+async def test_first_poll_only_records_baseline(bgg_cog, mock_bgg_client):
+    """Test that the first snapshot posts nothing."""
+    bgg_cog.bot.get_channel = MagicMock()
+    bgg_cog._save_hot_feed({"channels": [1], "snapshot": None})
+
+    await bgg_cog.poll_hot_feed.coro(bgg_cog)
+
+    bgg_cog.bot.get_channel.assert_not_called()
+    mock_bgg_client.fetch_things.assert_not_called()
+    assert bgg_cog._load_hot_feed()["snapshot"] == hot("a", "new1", "new2")
+
+
+@pytest.mark.asyncio
+async def test_empty_hot_list_is_not_a_baseline(bgg_cog, mock_bgg_client):
+    """Test that an empty fetch neither posts nor replaces the snapshot."""
+    bgg_cog.bot.get_channel = MagicMock()
+    bgg_cog._save_hot_feed({"channels": [1], "snapshot": []})
+
+    mock_bgg_client.fetch_hot_items.return_value = []
+    await bgg_cog.poll_hot_feed.coro(bgg_cog)
+    assert bgg_cog._load_hot_feed()["snapshot"] == []
+
+    # An empty stored snapshot is treated as no baseline
+    mock_bgg_client.fetch_hot_items.return_value = hot("a", "new1", "new2")
+    await bgg_cog.poll_hot_feed.coro(bgg_cog)
+
+    bgg_cog.bot.get_channel.assert_not_called()
+    mock_bgg_client.fetch_things.assert_not_called()
+    assert bgg_cog._load_hot_feed()["snapshot"] == hot("a", "new1", "new2")
+
+
+def test_long_names_fit_discord_field_limit(bgg_cog):
+    """Test that every field stays within Discord's 1024 characters."""
+    current = [
+        dict(item, name=f"{item['name']} " + "Deluxe Collector's Edition " * 4)
+        for item in hot(*(f"g{n}" for n in range(20)))
+    ]
+    diff = diff_hot_lists(hot(*(f"old{n}" for n in range(20))), current)
+
+    embed = bgg_cog._render_hot_update(diff, {})
+
+    assert all(len(field.value) <= 1024 for field in embed.fields)
+    assert "more" in embed.fields[0].value
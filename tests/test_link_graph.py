@@ -0,0 +1,205 @@
+import pytest
+import discord
+from discord.ext import commands
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.bgg_api import BGGClient
+from src.cogs.bgg_commands import BggCommands
+from src.link_graph import EXPANSION_LINK, FAMILY_LINK, LinkGraph
+
+FAMILY_XML = b"""<items><item type="boardgamefamily" id="3">
+<name type="primary" sortindex="1" value="Catan"/>
+<link type="boardgamefamily" id="13" value="CATAN" inbound="true"/>
+<link type="boardgamefamily" id="926" value="CATAN: Seafarers" inbound="true"/>
+</item></items>"""
+
+
+def thing(game_id, *links, game_type="boardgame"):
+    """Builds a parsed thing linking to the given (type, id, inbound) tuples."""
+    return {
+        "id": game_id,
+        "type": game_type,
+        "name": f"Game {game_id}",
+        "year": "2020",
+        "links": [
+            {"type": t, "id": i, "value": f"Game {i}", "inbound": inbound}
+            for t, i, inbound in links
+        ],
+    }
+
+
+# Base game 1 has 50 expansions; expansion 100 has a mini expansion of its own
+# and links back to its base game
+GAMES = {
+    "1": thing(
+        "1",
+        *[(EXPANSION_LINK, str(100 + n), False) for n in range(50)],
+        (FAMILY_LINK, "3", False),
+    ),
+    "100": thing(
+        "100",
+        (EXPANSION_LINK, "1", True),
+        (EXPANSION_LINK, "200", False),
+        game_type="boardgameexpansion",
+    ),
+    "200": thing("200", (EXPANSION_LINK, "100", True)),
+    **{str(100 + n): thing(str(100 + n)) for n in range(1, 50)},
+}
+
+
+@pytest.fixture
+def mock_bgg_client():
+    """Fixture for a mocked BGGClient serving GAMES."""
+    client = MagicMock(spec=BGGClient)
+    client.is_degraded = MagicMock(return_value=False)
+    client.fetch_things = MagicMock(
+        side_effect=lambda ids, stats=False: [GAMES[i] for i in ids if i in GAMES]
+    )
+    client.fetch_families = MagicMock(
+        return_value=[
+            {
+                "id": "3",
+                "type": FAMILY_LINK,
+                "name": "Catan",
+                "links": [
+                    {
+                        "type": FAMILY_LINK,
+                        "id": i,
+                        "value": f"Game {i}",
+                        "inbound": True,
+                    }
+                    for i in ("1", "100")
+                ],
+            }
+        ]
+    )
+    return client
+
+
+def test_walk_fetches_one_batch_per_level(mock_bgg_client):
+    """Test that 50 expansions and their children take one fetch per level."""
+    graph = LinkGraph(mock_bgg_client).walk("1", [EXPANSION_LINK], max_depth=2)
+
+    assert [len(level) for level in graph["levels"]] == [50, 1]
+    assert graph["levels"][1][0]["node"]["id"] == "200"
+    assert graph["levels"][1][0]["parent"]["id"] == "100"
+    assert not graph["truncated"]
+    # Root, then one call per level; the client splits each into batches of 20
+    assert mock_bgg_client.fetch_things.call_count == 3
+    assert len(mock_bgg_client.fetch_things.call_args_list[1].args[0]) == 50
+
+
+def test_walk_is_bounded_and_cached(mock_bgg_client):
+    """Test that max_nodes truncates the walk and repeat walks hit the cache."""
+    link_graph = LinkGraph(mock_bgg_client)
+
+    graph = link_graph.walk("1", [EXPANSION_LINK], max_depth=2, max_nodes=10)
+    assert [len(level) for level in graph["levels"]] == [10]  # No budget left
+    assert graph["truncated"]
+
+    mock_bgg_client.fetch_things.reset_mock()
+    link_graph.walk("1", [EXPANSION_LINK], max_depth=1, max_nodes=10)
+    mock_bgg_client.fetch_things.assert_not_called()
+
+
+def test_walk_through_families(mock_bgg_client):
+    """Test that families are fetched separately and lead to their other games."""
+    graph = LinkGraph(mock_bgg_client).walk("1", [FAMILY_LINK], max_depth=2)
+
+    mock_bgg_client.fetch_families.assert_called_once_with(["3"])
+    assert [entry["node"]["id"] for entry in graph["levels"][0]] == ["3"]
+    # The root game itself isn't repeated as a member
+    (member,) = graph["levels"][1]
+    assert member["node"]["id"] == "100"
+    assert member["node"]["name"] == "Game 100"  # Taken from the family's link
+    # Only the root game is fetched as a thing; members come from the family
+    mock_bgg_client.fetch_things.assert_called_once_with(["1"])
+
+
+def test_overlapping_families_each_list_shared_members(mock_bgg_client):
+    """Test that a game in two of the root's families is listed under both."""
+
+    def family(family_id, *member_ids):
+        return {
+            "id": family_id,
+            "type": FAMILY_LINK,
+            "name": f"Family {family_id}",
+            "links": [
+                {"type": FAMILY_LINK, "id": i, "value": f"Game {i}", "inbound": True}
+                for i in member_ids
+            ],
+        }
+
+    games = {"1": thing("1", (FAMILY_LINK, "3", False), (FAMILY_LINK, "4", False))}
+    mock_bgg_client.fetch_things.side_effect = lambda ids, stats=False: [
+        games[i] for i in ids
+    ]
+    mock_bgg_client.fetch_families.return_value = [
+        family("3", "1", "7"),
+        family("4", "7", "1", "8"),
+    ]
+
+    graph = LinkGraph(mock_bgg_client).walk("1", [FAMILY_LINK], max_depth=2)
+
+    members = [
+        (entry["parent"]["id"], entry["node"]["id"]) for entry in graph["levels"][1]
+    ]
+    assert members == [("3", "7"), ("4", "7"), ("4", "8")]
+
+
+def test_fetch_families_parses_links():
+    """Test that family members are parsed from the family endpoint."""
+    client = BGGClient()
+    client.session.get = MagicMock(return_value=MagicMock(content=FAMILY_XML))
+
+    (family,) = client.fetch_families(["3"])
+
+    assert family["name"] == "Catan"
+    assert [link["id"] for link in family["links"]] == ["13", "926"]
+    assert client.session.get.call_args.kwargs["params"] == {"id": "3"}
+
+
+@pytest.fixture
+@patch("src.cogs.bgg_commands.BGGClient")
+def bgg_cog(MockBGGClient, mock_bgg_client):
+    """Fixture for the BggCommands cog with a mocked client."""
+    MockBGGClient.return_value = mock_bgg_client
+    cog = BggCommands(bot=AsyncMock(spec=commands.Bot))
+    cog.resolver.resolve = MagicMock(
+        return_value={"id": "1", "name": None, "year": None}
+    )
+    return cog
+
+
+@pytest.fixture
+def mock_ctx():
+    ctx = AsyncMock(spec=commands.Context)
+    ctx.send = AsyncMock()
+    ctx.defer = AsyncMock()
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_bgg_expansions_lists_tree(bgg_cog, mock_ctx):
+    """Test that expansions are listed with deeper ones nested under them."""
+    await bgg_cog.bgg_expansions.callback(bgg_cog, mock_ctx, query="1")
+
+    embed = mock_ctx.send.call_args.kwargs["embed"]
+    assert isinstance(embed, discord.Embed)
+    assert embed.title == "Expansions for Game 1"
+    lines = embed.description.split("\n")
+    assert lines[0].startswith("1. [Game 100]")
+    assert lines[1].startswith("  ↳ [Game 200]")
+    assert len(embed.description) <= 4096
+    assert embed.footer.text == "51 expansions"
+
+
+@pytest.mark.asyncio
+async def test_bgg_family_shows_members(bgg_cog, mock_ctx):
+    """Test that each family becomes a field listing its other games."""
+    await bgg_cog.bgg_family.callback(bgg_cog, mock_ctx, query="1")
+
+    embed = mock_ctx.send.call_args.kwargs["embed"]
+    (field,) = embed.fields
+    assert field.name == "Catan"
+    assert field.value.startswith("[Game 100]")
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import time
+
+from src import profiling
+
+
+def busy_wait_for_profiler(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sample_thread_returns_collapsed_stacks():
+    """Test that sampling another thread yields root-first collapsed stacks."""
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_wait_for_profiler, args=(stop,))
+    worker.start()
+    try:
+        folded = profiling.sample_thread(worker.ident, 0.2)
+    finally:
+        stop.set()
+        worker.join()
+
+    lines = folded.splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "busy_wait_for_profiler" in folded
+    assert stack.split(";")[0].startswith("_bootstrap")
+
+
+def test_profile_loop_profiles_loop_thread():
+    """Test that cProfile runs inside the event loop's thread, not the caller's."""
+    loop = asyncio.new_event_loop()
+
+    async def spin():
+        while True:
+            sum(range(1000))
+            await asyncio.sleep(0)
+
+    loop_thread = threading.Thread(target=loop.run_forever)
+    loop_thread.start()
+    task = asyncio.run_coroutine_threadsafe(spin(), loop)
+    try:
+        profiler = profiling.profile_loop(loop, 0.2)
+    finally:
+        task.cancel()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.close()
+
+    text = profiling.format_pstats(profiler)
+    assert "spin" in text
+    assert profiling.dump_pstats(profiler)
@@ -0,0 +1,161 @@
+import pytest
+import discord
+from discord.ext import commands
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.bgg_api import BGGClient, BGGUnavailableError
+from src.cogs.bgg_commands import BggCommands
+from src.ranks_store import RanksStore, build_ranks_store
+
+RANKS_CSV = """id,name,yearpublished,rank,bayesaverage,average,usersrated,is_expansion,averageweight
+174430,Gloomhaven,2017,3,8.35,8.57,62000,0,3.91
+224517,Brass: Birmingham,2018,1,8.41,8.59,48000,0,3.87
+161936,Pandemic Legacy: Season 1,2015,2,8.38,8.52,52000,0,2.83
+13,CATAN,1995,500,6.9,7.1,120000,0,2.29
+999999,Tiny Obscure Game,2023,,0,9.9,12,0,
+266192,Wingspan: European Expansion,2019,,0,8.0,9000,1,2.4
+"""
+
+
+@pytest.fixture
+def ranks_store(tmp_path):
+    """Fixture for a ranks store built from a small CSV dump."""
+    csv_path = tmp_path / "boardgames_ranks.csv"
+    csv_path.write_text(RANKS_CSV, encoding="utf-8")
+    build_ranks_store(csv_path, tmp_path / "store")
+    return RanksStore.open(tmp_path / "store")
+
+
+def test_get_by_id(ranks_store):
+    """Test looking up a single game by ID."""
+    game = ranks_store.get("224517")
+
+    assert game["name"] == "Brass: Birmingham"
+    assert game["year"] == "2018"
+    assert game["rank"] == 1
+    assert game["weight"] == pytest.approx(3.87)
+    assert ranks_store.get("12345") is None
+
+
+def test_top_by_rank_skips_unranked_and_expansions(ranks_store):
+    """Test that top-N by rank is ordered and excludes unranked games."""
+    games = ranks_store.top_by_rank(10)
+
+    assert [g["id"] for g in games] == ["224517", "161936", "174430", "13"]
+
+
+def test_filters(ranks_store):
+    """Test year, weight and users-rated filters."""
+    recent_light = ranks_store.top_by_rank(10, year_from=2015, max_weight=3.0)
+    top_rated = ranks_store.top_by_rating(2, min_users_rated=1000)
+
+    assert [g["id"] for g in recent_light] == ["161936"]
+    assert [g["id"] for g in top_rated] == ["224517", "174430"]
+
+
+def test_open_missing_store_returns_none(tmp_path):
+    """Test that an unbuilt store is reported as unavailable."""
+    assert RanksStore.open(tmp_path / "missing") is None
+
+
+def test_find_by_name(ranks_store):
+    """Test name lookups: exact matches first, then the most rated containing match."""
+    assert ranks_store.find("the Gloomhaven ")["id"] == "174430"
+    assert ranks_store.find("brass birmingham")["id"] == "224517"
+    assert ranks_store.find("Pandemic")["id"] == "161936"
+    assert ranks_store.find("Twilight Imperium") is None
+
+
+def test_open_store_without_name_keys_returns_none(ranks_store, tmp_path):
+    """Test that a store built before name lookups asks to be rebuilt."""
+    (tmp_path / "store" / "name_key_hashes.npy").unlink()
+
+    assert RanksStore.open(tmp_path / "store") is None
+
+
+@pytest.fixture
+def mock_bgg_client():
+    """Fixture for a mocked BGGClient during an outage."""
+    client = MagicMock(spec=BGGClient)
+    client.is_degraded = MagicMock(return_value=True)
+    client.search_bgg = MagicMock(side_effect=BGGUnavailableError("down"))
+    client.fetch_thing_data = MagicMock(side_effect=BGGUnavailableError("down"))
+    return client
+
+
+@pytest.fixture
+@patch("src.cogs.bgg_commands.BGGClient")
+def bgg_cog(MockBGGClient, mock_bgg_client, ranks_store):
+    """Fixture for the BggCommands cog backed by the small ranks store."""
+    MockBGGClient.return_value = mock_bgg_client
+    cog = BggCommands(bot=AsyncMock(spec=commands.Bot))
+    cog._ranks = ranks_store
+    cog._ranks_loaded = True
+    return cog
+
+
+@pytest.fixture
+def mock_ctx():
+    ctx = AsyncMock(spec=commands.Context)
+    ctx.send = AsyncMock()
+    ctx.defer = AsyncMock()
+    return ctx
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["224517", "Brass: Birmingham"])
+async def test_bgg_info_falls_back_to_ranks(bgg_cog, mock_ctx, query):
+    """Test that IDs and names are answered from the dump when BGG is down."""
+    await bgg_cog.bgg_info.callback(bgg_cog, mock_ctx, query=query)
+
+    embed = mock_ctx.send.call_args.kwargs["embed"]
+    assert isinstance(embed, discord.Embed)
+    assert embed.title == "Brass: Birmingham (2018)"
+
+
+@pytest.mark.asyncio
+async def test_bgg_info_unknown_name_reports_outage(bgg_cog, mock_ctx):
+    """Test that a name missing from the dump still surfaces the BGG error."""
+    await bgg_cog.bgg_info.callback(bgg_cog, mock_ctx, query="Twilight Imperium")
+
+    assert "down" in mock_ctx.send.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_bgg_top(bgg_cog, mock_ctx, mock_bgg_client):
+    """Test that /bggtop lists ranked games from the dump without BGG calls."""
+    await bgg_cog.bgg_top.callback(bgg_cog, mock_ctx, count=2)
+
+    embed = mock_ctx.send.call_args.kwargs["embed"]
+    assert embed.title == "BGG Top 2 by Rank"
+    assert embed.description.startswith("1. [Brass: Birmingham]")
+    assert "Pandemic Legacy" in embed.description
+    mock_bgg_client.search_bgg.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bgg_top_rejects_unknown_sort(bgg_cog, mock_ctx):
+    """Test that only rank and rating sorts are accepted."""
+    await bgg_cog.bgg_top.callback(bgg_cog, mock_ctx, sort="weight")
+
+    mock_ctx.send.assert_called_once_with(
+        "Sort must be `rank` or `rating`.", ephemeral=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_bgg_top_max_weight_without_weight_data(bgg_cog, mock_ctx, tmp_path):
+    """Test that max_weight is refused when the dump has no weight column."""
+    csv_path = tmp_path / "official.csv"
+    csv_path.write_text(
+        "\n".join(line.rsplit(",", 1)[0] for line in RANKS_CSV.splitlines()),
+        encoding="utf-8",
+    )
+    build_ranks_store(csv_path, tmp_path / "official")
+    bgg_cog._ranks = RanksStore.open(tmp_path / "official")
+
+    await bgg_cog.bgg_top.callback(bgg_cog, mock_ctx, max_weight=3.0)
+
+    assert (
+        "Weight data isn't in the loaded ranks dump" in mock_ctx.send.call_args.args[0]
+    )
@@ -0,0 +1,77 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.bgg_api import BGGClient
+from src.resolver import QueryResolver, normalize_query
+
+
+@pytest.fixture
+def mock_bgg_client():
+    """Fixture for a mocked BGGClient that always finds Wingspan."""
+    client = MagicMock(spec=BGGClient)
+    client.search_bgg = MagicMock(
+        return_value=[{"id": "266192", "name": "Wingspan", "year": "2019"}]
+    )
+    return client
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("Wingspan ", "wingspan"),
+        ("WINGSPAN", "wingspan"),
+        ("  Ticket  to   Ride! ", "ticket to ride"),
+        ("The Castles of Burgundy", "castles of burgundy"),
+        ("Brass: Birmingham", "brass birmingham"),
+        ("The", "the"),  # A lone article is kept
+    ],
+)
+def test_normalize_query(query, expected):
+    """Test that cosmetic differences normalize to the same key."""
+    assert normalize_query(query) == expected
+
+
+def test_repeated_queries_hit_cache(mock_bgg_client):
+    """Test that variants of the same name only search BGG once."""
+    resolver = QueryResolver(mock_bgg_client)
+
+    for query in ("wingspan", "Wingspan ", "WINGSPAN"):
+        assert resolver.resolve(query) == {
+            "id": "266192",
+            "name": "Wingspan",
+            "year": "2019",
+        }
+
+    mock_bgg_client.search_bgg.assert_called_once_with("wingspan")
+    assert resolver.stats() == {"entries": 1, "hits": 2}
+
+
+def test_numeric_query_skips_search(mock_bgg_client):
+    """Test that IDs are passed through without a search."""
+    resolver = QueryResolver(mock_bgg_client)
+
+    assert resolver.resolve(" 12345 ") == {"id": "12345", "name": None, "year": None}
+    mock_bgg_client.search_bgg.assert_not_called()
+
+
+@patch("src.resolver.time.monotonic")
+def test_expired_entries_search_again(mock_monotonic, mock_bgg_client):
+    """Test that entries older than the TTL trigger a fresh search."""
+    resolver = QueryResolver(mock_bgg_client, ttl=60)
+
+    mock_monotonic.return_value = 0
+    resolver.resolve("Wingspan")
+    mock_monotonic.return_value = 61
+    resolver.resolve("Wingspan")
+
+    assert mock_bgg_client.search_bgg.call_count == 2
+
+
+def test_no_results_are_not_cached(mock_bgg_client):
+    """Test that failed searches return None and are retried next time."""
+    mock_bgg_client.search_bgg.return_value = []
+    resolver = QueryResolver(mock_bgg_client)
+
+    assert resolver.resolve("nonexistent game") is None
+    assert resolver.resolve("nonexistent game") is None
+    assert mock_bgg_client.search_bgg.call_count == 2
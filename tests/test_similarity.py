@@ -0,0 +1,68 @@
+import pytest
+
+from src.similarity import SimilarityIndex
+
+
+def make_game(game_id, mechanics=(), designers=(), weight=None, average=None):
+    """Builds parsed thing data shaped like BGGClient._parse_thing_data output."""
+    links = [
+        {"type": "boardgamemechanic", "id": m, "value": f"Mechanic {m}"}
+        for m in mechanics
+    ] + [
+        {"type": "boardgamedesigner", "id": d, "value": f"Designer {d}"}
+        for d in designers
+    ]
+    game = {"id": game_id, "name": f"Game {game_id}", "year": "2020", "links": links}
+    if weight or average:
+        game["stats"] = {"weight": weight, "average": average}
+    return game
+
+
+@pytest.fixture
+def index():
+    """Fixture for a small index with two close games and one unrelated game."""
+    idx = SimilarityIndex(initial_capacity=2)  # Force the arrays to grow
+    idx.add_game(make_game("1", mechanics=["a", "b", "c"], designers=["x"]))
+    idx.add_game(make_game("2", mechanics=["a", "b", "c"], designers=["x"]))
+    idx.add_game(make_game("3", mechanics=["a", "b"]))
+    idx.add_game(make_game("4", mechanics=["z"], designers=["y"]))
+    return idx
+
+
+def test_most_similar_orders_by_score(index):
+    """Test that the closest game ranks first and unrelated games are dropped."""
+    results = index.most_similar("1", k=10)
+
+    assert [game["id"] for game, _ in results] == ["2", "3"]
+    assert results[0][1] == pytest.approx(1.0)
+    assert results[0][1] > results[1][1]
+
+
+def test_add_game_replaces_existing_row(index):
+    """Test that re-adding a game replaces its features instead of appending."""
+    index.add_game(make_game("2", mechanics=["z"], designers=["y"]))
+
+    results = index.most_similar("1", k=10)
+
+    assert len(index) == 4
+    assert [game["id"] for game, _ in results] == ["3"]
+
+
+def test_games_without_links_are_skipped():
+    """Test that things parsed without link data are not indexed."""
+    idx = SimilarityIndex()
+    idx.add_game({"id": "1", "name": "No Links"})
+
+    assert len(idx) == 0
+    assert idx.most_similar("1") == []
+
+
+def test_repeated_adds_do_not_grow_index(index):
+    """Test that re-adding games, changed or not, keeps storage bounded."""
+    for i in range(1000):
+        index.add_game(make_game("1", mechanics=["a", "b", "c"], designers=["x"]))
+        index.add_game(make_game("3", mechanics=["a", "b"], weight=str(1 + i % 4)))
+
+    assert len(index) == 4
+    assert index._nnz <= 2 * (4 + 3 + 3 + 2)
+    assert [game["id"] for game, _ in index.most_similar("1", k=10)] == ["2", "3"]
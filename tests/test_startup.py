@@ -0,0 +1,47 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from src.startup import StartupTimer, command_tree_hash, needs_sync, save_sync_hash
+
+
+def make_tree(description="Say hello"):
+    """Builds a command tree with a single slash command."""
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.default())
+
+    @bot.tree.command(name="hello", description=description)
+    async def hello(interaction: discord.Interaction, name: str):
+        pass
+
+    return bot.tree
+
+
+def test_command_tree_hash_tracks_signatures():
+    """Test that the hash is stable and changes when a command changes."""
+    assert command_tree_hash(make_tree()) == command_tree_hash(make_tree())
+    assert command_tree_hash(make_tree()) != command_tree_hash(make_tree("Hi"))
+
+
+def test_needs_sync_after_save(tmp_path):
+    """Test that a persisted hash suppresses the next sync."""
+    hash_file = tmp_path / "command_tree.sha256"
+    tree = make_tree()
+
+    changed, tree_hash = needs_sync(tree, hash_file)
+    assert changed
+
+    save_sync_hash(hash_file, tree_hash)
+    assert needs_sync(tree, hash_file) == (False, tree_hash)
+    assert needs_sync(make_tree("Hi"), hash_file)[0]
+
+
+def test_startup_timer_report():
+    """Test that every recorded phase appears in the report."""
+    timer = StartupTimer()
+    with timer.phase("cogs"):
+        pass
+    timer.mark("connect", timer.started_at)
+
+    report = timer.report()
+    assert report.startswith("Startup took")
+    assert "cogs" in report and "connect" in report
@@ -0,0 +1,149 @@
+import json
+import pytest
+from discord.ext import commands
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.bgg_api import BGGClient
+from src.cogs.bgg_commands import BggCommands
+from src.tracing import JsonLinesExporter, Tracer, span
+
+THING_XML = b"""<items><item type="boardgame" id="13">
+<name type="primary" value="CATAN"/><yearpublished value="1995"/></item></items>"""
+
+
+class ListExporter:
+    """Collects exported traces for assertions."""
+
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace.to_dict())
+
+
+@pytest.fixture
+def exporter():
+    return ListExporter()
+
+
+def test_spans_nest_under_trace(exporter):
+    """Test that spans record their parent and attributes."""
+    tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+
+    with tracer.trace("bgghot", user_id="1"):
+        with span("outer") as outer:
+            outer.set("cache", "miss")
+            with span("inner"):
+                pass
+
+    (trace,) = exporter.traces
+    assert trace["name"] == "bgghot"
+    assert trace["attributes"] == {"user_id": "1"}
+    spans = {s["name"]: s for s in trace["spans"]}
+    assert spans["inner"]["parent_id"] == spans["outer"]["span_id"]
+    assert spans["outer"]["attributes"] == {"cache": "miss"}
+
+
+def test_unsampled_traces_are_not_exported(exporter):
+    """Test that a zero sample rate records and exports nothing."""
+    tracer = Tracer(sample_rate=0.0, exporters=[exporter])
+
+    with tracer.trace("bgginfo"):
+        with span("resolve") as resolve_span:
+            resolve_span.set("cache", "hit")  # No-op outside a sampled trace
+
+    assert exporter.traces == []
+
+
+def test_errors_are_recorded(exporter):
+    """Test that an exception marks both the span and the trace."""
+    tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+
+    with pytest.raises(ValueError):
+        with tracer.trace("bgginfo"):
+            with span("render"):
+                raise ValueError("boom")
+
+    (trace,) = exporter.traces
+    assert trace["error"] == "ValueError: boom"
+    assert trace["spans"][0]["error"] == "ValueError: boom"
+
+
+def test_bgg_client_emits_request_and_parse_spans(exporter):
+    """Test that BGG requests report cache status and parsing is timed separately."""
+    tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+    client = BGGClient()
+    client.session.get = MagicMock(return_value=MagicMock(content=THING_XML))
+
+    with tracer.trace("bgginfo"):
+        client.fetch_thing_data("13")
+
+    names = [s["name"] for s in exporter.traces[0]["spans"]]
+    assert names == ["bgg.request", "xml.parse", "parse.thing"]
+    request_span = exporter.traces[0]["spans"][0]
+    assert request_span["attributes"]["cache"] == "miss"
+    assert request_span["attributes"]["endpoint"] == "thing"
+
+
+def test_json_lines_exporter_writes_one_line_per_trace(tmp_path):
+    """Test that traces are appended to the file as JSON lines."""
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(sample_rate=1.0, exporters=[JsonLinesExporter(str(path))])
+
+    for _ in range(2):
+        with tracer.trace("bggsearch"):
+            with span("bgg.request"):
+                pass
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["spans"][0]["name"] == "bgg.request"
+
+
+@pytest.fixture
+def traced_cog(exporter):
+    """Fixture for the cog with every command invocation traced."""
+    with patch(
+        "src.cogs.bgg_commands.tracer",
+        Tracer(sample_rate=1.0, exporters=[exporter]),
+    ):
+        yield BggCommands(bot=AsyncMock(spec=commands.Bot))
+
+
+def command_ctx(command):
+    ctx = MagicMock(spec=commands.Context)
+    ctx.command = command
+    ctx.author.id = 1
+    ctx.interaction = None
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_prefix_group_is_traced_once(traced_cog, exporter):
+    """Test that a group and its subcommand produce one trace, for the subcommand."""
+    group = MagicMock(spec=commands.Group, qualified_name="bggfav")
+    subcommand = MagicMock(spec=commands.Command, qualified_name="bggfav add")
+    ctx = command_ctx(group)
+
+    # discord.py's order: group hooks, then the subcommand's
+    await traced_cog.cog_before_invoke(ctx)
+    await traced_cog.cog_after_invoke(ctx)
+    ctx.command = subcommand
+    await traced_cog.cog_before_invoke(ctx)
+    await traced_cog.cog_after_invoke(ctx)
+
+    assert [trace["name"] for trace in exporter.traces] == ["bggfav add"]
+
+
+@pytest.mark.asyncio
+async def test_failed_command_ends_its_trace(traced_cog, exporter):
+    """Test that an error ends the trace even when the after hook is skipped."""
+    ctx = command_ctx(MagicMock(spec=commands.Command, qualified_name="bgginfo"))
+
+    await traced_cog.cog_before_invoke(ctx)
+    error = commands.CommandInvokeError(ValueError("boom"))
+    await traced_cog.cog_command_error(ctx, error)
+
+    (trace,) = exporter.traces
+    assert trace["error"] == "ValueError: boom"
+    assert traced_cog._trace_tokens == {}
@@ -34,6 +34,8 @@ def mock_bgg_client():
     client = MagicMock(spec=BGGClient)
     client.search_bgg = MagicMock()
     client.fetch_thing_data = MagicMock()
+    client.fetch_things = MagicMock()
+    client.is_degraded = MagicMock(return_value=False)
     return client
 
 
@@ -53,7 +55,9 @@ def bgg_cog(MockBGGClient, mock_bot, mock_bgg_client):
 @patch("builtins.open", new_callable=mock_open)  # Mock open globally
 @patch("json.load")
 @patch("json.dump")
+@patch("src.cogs.bgg_commands.time.time", return_value=1700000000.0)
 async def test_bggfav_add_new_user(
+    mock_time,
     mock_json_dump,
     mock_json_load,
     mock_open_func,
@@ -67,21 +71,35 @@ async def test_bggfav_add_new_user(
     mock_json_load.return_value = {}  # Start with empty data
     game_id_to_add = "9876"
     game_name = "Favorite Game"
-    mock_bgg_client.fetch_thing_data.return_value = {
-        "id": game_id_to_add,
-        "name": game_name,
-    }
+    mock_bgg_client.fetch_things.return_value = [
+        {
+            "id": game_id_to_add,
+            "name": game_name,
+            "year": "2021",
+            "thumbnail": "http://example.com/thumb.jpg",
+        }
+    ]
 
     # Call the callback directly, passing self (the cog instance)
     await bgg_cog.bggfav_add.callback(bgg_cog, mock_context, query=game_id_to_add)
 
     mock_context.defer.assert_called_once_with(ephemeral=True)
-    mock_bgg_client.fetch_thing_data.assert_called_once_with(
-        game_id_to_add, stats=False
-    )
+    mock_bgg_client.fetch_things.assert_called_once_with([game_id_to_add])
     mock_json_load.assert_called_once()  # Called by _load_user_data
     # Check that save was called with the correct data structure
-    expected_data = {str(mock_context.author.id): {"favorites": [game_id_to_add]}}
+    expected_data = {
+        str(mock_context.author.id): {
+            "favorites": [
+                {
+                    "id": game_id_to_add,
+                    "name": game_name,
+                    "year": "2021",
+                    "thumbnail": "http://example.com/thumb.jpg",
+                    "updated_at": 1700000000.0,
+                }
+            ]
+        }
+    }
     mock_json_dump.assert_called_once()
     call_args, call_kwargs = mock_json_dump.call_args
     assert call_args[0] == expected_data
@@ -112,35 +130,280 @@ async def test_bggfav_remove(
     game_id_to_remove = "5555"
     other_game_id = "1111"
     game_name = "Game To Remove"
-    initial_data = {user_id: {"favorites": [other_game_id, game_id_to_remove]}}
+    other_favorite = {
+        "id": other_game_id,
+        "name": "Other Game",
+        "year": "2001",
+        "thumbnail": None,
+        "updated_at": 1700000000.0,
+    }
+    initial_data = {
+        user_id: {
+            "favorites": [
+                other_favorite,
+                {
+                    "id": game_id_to_remove,
+                    "name": game_name,
+                    "year": "2010",
+                    "thumbnail": None,
+                    "updated_at": 1700000000.0,
+                },
+            ]
+        }
+    }
 
     mock_path_exists.return_value = True
     mock_json_load.return_value = initial_data
-    mock_bgg_client.fetch_thing_data.return_value = {
-        "id": game_id_to_remove,
-        "name": game_name,
-    }  # For confirmation message
-
     # Call the callback directly
-    await bgg_cog.bggfav_remove.callback(
-        bgg_cog, mock_context, game_id=game_id_to_remove
-    )
+    await bgg_cog.bggfav_remove.callback(bgg_cog, mock_context, games=game_id_to_remove)
 
     mock_context.defer.assert_called_once_with(ephemeral=True)
     mock_json_load.assert_called_once()
     # Check saved data
-    expected_data = {user_id: {"favorites": [other_game_id]}}
+    expected_data = {user_id: {"favorites": [other_favorite]}}
     mock_json_dump.assert_called_once()
     call_args, call_kwargs = mock_json_dump.call_args
     assert call_args[0] == expected_data
 
-    mock_bgg_client.fetch_thing_data.assert_called_once_with(
-        game_id_to_remove, stats=False
-    )  # Called for name
+    mock_bgg_client.fetch_thing_data.assert_not_called()  # Name comes from the store
     mock_context.send.assert_called_once_with(
         f"Removed '{game_name}' (ID: {game_id_to_remove}) from your favorites.",
         ephemeral=True,
     )
 
 
+@pytest.mark.asyncio
+@patch("src.cogs.bgg_commands.Path.exists")
+@patch("builtins.open", new_callable=mock_open)
+@patch("json.load")
+async def test_bggfav_list_makes_no_bgg_calls(
+    mock_json_load,
+    mock_open_func,
+    mock_path_exists,
+    bgg_cog,
+    mock_context,
+    mock_bgg_client,
+):
+    """Test that listing renders stored entries, including legacy bare IDs."""
+    user_id = str(mock_context.author.id)
+    mock_path_exists.return_value = True
+    mock_json_load.return_value = {
+        user_id: {
+            "favorites": [
+                {
+                    "id": "13",
+                    "name": "CATAN",
+                    "year": "1995",
+                    "thumbnail": "http://example.com/catan.jpg",
+                    "updated_at": 1700000000.0,
+                },
+                "822",  # Stored before favorites were denormalized
+            ]
+        }
+    }
+
+    await bgg_cog.bggfav_list.callback(bgg_cog, mock_context)
+
+    mock_bgg_client.fetch_thing_data.assert_not_called()
+    embed = mock_context.send.call_args.kwargs["embed"]
+    assert "1. [CATAN (1995)](https://boardgamegeek.com/boardgame/13)" in (
+        embed.description
+    )
+    assert "2. [ID: 822 (N/A)]" in embed.description
+    assert embed.thumbnail.url == "http://example.com/catan.jpg"
+
+
+@pytest.mark.asyncio
+@patch("src.cogs.bgg_commands.Path.exists")
+@patch("builtins.open", new_callable=mock_open)
+@patch("json.load")
+@patch("json.dump")
+async def test_refresh_favorites_batches_stale_entries(
+    mock_json_dump,
+    mock_json_load,
+    mock_open_func,
+    mock_path_exists,
+    bgg_cog,
+    mock_bgg_client,
+):
+    """Test that stale and legacy entries are refreshed with one batched fetch."""
+    mock_path_exists.return_value = True
+    fresh = {
+        "id": "13",
+        "name": "CATAN",
+        "year": "1995",
+        "thumbnail": None,
+        "updated_at": 10**12,  # Far in the future, so never stale
+    }
+    mock_json_load.side_effect = lambda f: {
+        "1": {"favorites": [dict(fresh), "822"]},
+        "2": {"favorites": ["822"]},
+    }
+    mock_bgg_client.is_degraded.return_value = False
+    mock_bgg_client.fetch_things = MagicMock(
+        return_value=[{"id": "822", "name": "Carcassonne", "year": "2000"}]
+    )
+
+    await bgg_cog.refresh_favorites.coro(bgg_cog)
+
+    mock_bgg_client.fetch_things.assert_called_once_with(["822"])
+    saved = mock_json_dump.call_args[0][0]
+    assert saved["1"]["favorites"][0] == fresh
+    assert saved["1"]["favorites"][1]["name"] == "Carcassonne"
+    assert saved["2"]["favorites"][0]["name"] == "Carcassonne"
+
+
+@pytest.mark.asyncio
+@patch("src.cogs.bgg_commands.FAVORITE_REFRESH_LIMIT", 2)
+@patch("src.cogs.bgg_commands.Path.exists")
+@patch("builtins.open", new_callable=mock_open)
+@patch("json.load")
+@patch("json.dump")
+async def test_refresh_favorites_oldest_first_and_backs_off_missing(
+    mock_json_dump,
+    mock_json_load,
+    mock_open_func,
+    mock_path_exists,
+    bgg_cog,
+    mock_bgg_client,
+):
+    """Test that the oldest entries go first and vanished IDs aren't retried hourly."""
+    mock_path_exists.return_value = True
+
+    def entry(game_id, updated_at):
+        return {
+            "id": game_id,
+            "name": None,
+            "year": None,
+            "thumbnail": None,
+            "updated_at": updated_at,
+        }
+
+    mock_json_load.side_effect = lambda f: {
+        "1": {"favorites": [entry("13", 100), entry("999", 0), entry("822", 50)]}
+    }
+    mock_bgg_client.is_degraded.return_value = False
+    mock_bgg_client.fetch_things = MagicMock(
+        return_value=[{"id": "822", "name": "Carcassonne", "year": "2000"}]
+    )
+
+    await bgg_cog.refresh_favorites.coro(bgg_cog)
+
+    mock_bgg_client.fetch_things.assert_called_once_with(["999", "822"])
+    saved = {f["id"]: f for f in mock_json_dump.call_args[0][0]["1"]["favorites"]}
+    assert saved["822"]["name"] == "Carcassonne"
+    assert saved["999"]["name"] is None
+    assert saved["999"]["updated_at"] > 10**9  # Waits a full period now
+    assert saved["13"]["updated_at"] == 100  # Left for the next run
+
+
+@pytest.mark.asyncio
+@patch("src.cogs.bgg_commands.Path.exists")
+@patch("builtins.open", new_callable=mock_open)
+@patch("json.load")
+@patch("json.dump")
+async def test_bggfav_add_bulk(
+    mock_json_dump,
+    mock_json_load,
+    mock_open_func,
+    mock_path_exists,
+    bgg_cog,
+    mock_context,
+    mock_bgg_client,
+):
+    """Test adding several names and IDs in one command and one save."""
+    user_id = str(mock_context.author.id)
+    mock_path_exists.return_value = True
+    mock_json_load.return_value = {
+        user_id: {
+            "favorites": [
+                {
+                    "id": "13",
+                    "name": "CATAN",
+                    "year": "1995",
+                    "thumbnail": None,
+                    "updated_at": 1700000000.0,
+                }
+            ]
+        }
+    }
+    mock_bgg_client.fetch_things.return_value = [
+        {"id": "13", "name": "CATAN", "year": "1995"},
+        {"id": "822", "name": "Carcassonne", "year": "2000"},
+    ]
+    search_results = {
+        "Wingspan": [{"id": "266192", "name": "Wingspan", "year": "2019"}],
+        "Azul": [{"id": "230802", "name": "Azul", "year": "2017"}],
+        "No Such Game": [],
+    }
+    mock_bgg_client.search_bgg.side_effect = lambda query: search_results[query]
+
+    await bgg_cog.bggfav_add.callback(
+        bgg_cog,
+        mock_context,
+        query="Wingspan, 13\n822, Azul,No Such Game, 999, wingspan",
+    )
+
+    # IDs are validated in one batched request, names searched once each
+    mock_bgg_client.fetch_things.assert_called_once_with(["13", "822", "999"])
+    assert mock_bgg_client.search_bgg.call_count == 3
+    mock_json_load.assert_called_once()
+    mock_json_dump.assert_called_once()
+    saved_ids = [f["id"] for f in mock_json_dump.call_args[0][0][user_id]["favorites"]]
+    assert saved_ids == ["13", "266192", "822", "230802"]
+
+    summary = mock_context.send.call_args[0][0]
+    assert summary.splitlines() == [
+        "- Added 'Wingspan' (ID: 266192) to your favorites.",
+        "- 'CATAN' (ID: 13) is already in your favorites.",
+        "- Added 'Carcassonne' (ID: 822) to your favorites.",
+        "- Added 'Azul' (ID: 230802) to your favorites.",
+        "- No games found matching 'No Such Game'.",
+        "- Could not verify game ID '999'. Please ensure it's a valid BGG ID.",
+        "- 'Wingspan' (ID: 266192) is already in your favorites.",
+    ]
+
+
+@pytest.mark.asyncio
+@patch("src.cogs.bgg_commands.Path.exists")
+@patch("builtins.open", new_callable=mock_open)
+@patch("json.load")
+@patch("json.dump")
+async def test_bggfav_remove_bulk_by_id_and_name(
+    mock_json_dump,
+    mock_json_load,
+    mock_open_func,
+    mock_path_exists,
+    bgg_cog,
+    mock_context,
+    mock_bgg_client,
+):
+    """Test removing several favorites by ID and stored name in one save."""
+    user_id = str(mock_context.author.id)
+    mock_path_exists.return_value = True
+    mock_json_load.return_value = {
+        user_id: {
+            "favorites": [
+                {"id": "13", "name": "CATAN", "year": "1995"},
+                {"id": "822", "name": "Carcassonne", "year": "2000"},
+                {"id": "266192", "name": "Wingspan", "year": "2019"},
+            ]
+        }
+    }
+
+    await bgg_cog.bggfav_remove.callback(
+        bgg_cog, mock_context, games="13, carcassonne, 555"
+    )
+
+    mock_bgg_client.search_bgg.assert_not_called()
+    mock_json_dump.assert_called_once()
+    saved = mock_json_dump.call_args[0][0][user_id]["favorites"]
+    assert [f["id"] for f in saved] == ["266192"]
+    assert mock_context.send.call_args[0][0].splitlines() == [
+        "- Removed 'CATAN' (ID: 13) from your favorites.",
+        "- Removed 'Carcassonne' (ID: 822) from your favorites.",
+        "- Game ID '555' was not found in your favorites.",
+    ]
+
+
 # Add tests for edge cases: removing non-existent ID, listing empty favorites, file not found initially etc.